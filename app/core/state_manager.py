@@ -9,6 +9,8 @@ Key features:
     - Hash-based cache invalidation
     - TTL-based expiration (default 24 hours)
     - Thread pool execution for heavy computations
+    - Concurrent requests for the same entry share a single computation
+    - Optional stale-while-revalidate serving of expired entries
     - Cache statistics and debugging tools
 
 Example:
@@ -63,8 +65,12 @@ class StateManager:
         """
         self.default_ttl = default_ttl_seconds
         self._cache: dict[str, dict[str, Any]] = {}
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
 
-    def _get_cache_key(self, user_storage_key: str, computation_key: str) -> str:
+    def _get_cache_key(
+        self, user_storage_key: str, computation_key: str, source_data: str | None = None
+    ) -> str:
         """Generate unique cache key for user data + computation.
 
         Uses hash of general storage data to automatically invalidate cache when
@@ -73,6 +79,8 @@ class StateManager:
         Args:
             user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
             computation_key: Unique identifier for this computation
+            source_data: Source data the computation was built from. If None, the
+                        current value in general storage is used
 
         Returns:
             Cache key string combining storage key, computation key, and data hash
@@ -82,7 +90,11 @@ class StateManager:
         """
         # Use data hash to invalidate cache when data changes
         try:
-            user_data = app.storage.general.get(user_storage_key, "")
+            user_data = (
+                source_data
+                if source_data is not None
+                else app.storage.general.get(user_storage_key, "")
+            )
             data_str = str(user_data) if user_data is not None else ""
             data_hash = hash(data_str)
             return f"{user_storage_key}:{computation_key}:{data_hash}"
@@ -110,18 +122,33 @@ class StateManager:
         computation_key: str,
         compute_fn: Callable[[], T],
         ttl_seconds: int | None = None,
+        stale_ok: bool = False,
+        source_data: str | None = None,
     ) -> T:
         """Get cached result or compute if not available/expired.
 
         First checks cache for a valid entry. If not found or expired, runs the
         computation function in a thread pool to avoid blocking the UI, then
-        caches the result.
+        caches the result. Callers arriving while the same entry is being computed
+        await that computation instead of starting their own.
+
+        With stale_ok, an expired entry for unchanged source data is returned
+        immediately while a background task recomputes it (stale-while-revalidate),
+        so TTL expiry never puts the computation on the caller's path.
+
+        Callers whose compute_fn closes over source data read before an await should
+        pass it as source_data: the entry is then keyed on that data rather than on
+        whatever general storage holds when the cache is checked. A result whose data
+        was replaced in storage while it was being computed is returned but not cached.
 
         Args:
             user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
             computation_key: Unique identifier for this computation (e.g., 'net_worth_calc')
             compute_fn: Callable that computes the value (should be thread-safe)
             ttl_seconds: Cache time-to-live in seconds. If None, uses default TTL (24h)
+            stale_ok: If True, return an expired entry and refresh it in the background
+            source_data: Source data compute_fn is built from, used for the cache key
+                        instead of the current value in general storage
 
         Returns:
             Computed or cached value of type T
@@ -136,7 +163,7 @@ class StateManager:
             ...     ttl_seconds=3600
             ... )
         """
-        cache_key = self._get_cache_key(user_storage_key, computation_key)
+        cache_key = self._get_cache_key(user_storage_key, computation_key, source_data)
         ttl = ttl_seconds or self.default_ttl
 
         # Check cache first
@@ -145,24 +172,164 @@ class StateManager:
             metrics_collector.record_cache_hit()
             return self._cache[cache_key]["value"]
 
-        # Compute new value - run in thread pool to avoid blocking UI
-        logger.debug(f"Cache miss for {computation_key}, computing value")
-        metrics_collector.record_cache_miss()
-        try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, compute_fn)
-        except Exception as e:
-            # Direct fallback if there are thread pool issues (pickling errors, etc.)
-            logger.error(
-                f"Thread pool execution failed for {computation_key}, falling back to direct execution: {e}"
+        # Serve the expired entry and revalidate it in the background
+        if stale_ok and cache_key in self._cache:
+            logger.debug(f"Serving stale cache for {computation_key}, refreshing in background")
+            metrics_collector.record_cache_hit()
+            if cache_key not in self._in_flight:
+                task = asyncio.create_task(
+                    self._refresh(user_storage_key, computation_key, cache_key, compute_fn, ttl)
+                )
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return self._cache[cache_key]["value"]
+
+        # Another caller is already computing this entry - wait for its result
+        task = self._in_flight.get(cache_key)
+        if task is not None:
+            logger.debug(f"Waiting for in-flight computation of {computation_key}")
+            metrics_collector.record_cache_hit()
+        else:
+            logger.debug(f"Cache miss for {computation_key}, computing value")
+            metrics_collector.record_cache_miss()
+            task = self._start_computation(
+                user_storage_key, computation_key, cache_key, compute_fn, ttl
             )
-            result = compute_fn()
 
-        # Cache the result
-        self._cache[cache_key] = {"value": result, "timestamp": time.time(), "ttl": ttl}
+        return await asyncio.shield(task)
+
+    def _start_computation(
+        self,
+        user_storage_key: str,
+        computation_key: str,
+        cache_key: str,
+        compute_fn: Callable[[], T],
+        ttl: int,
+    ) -> asyncio.Task[T]:
+        """Start computing an entry in its own task and register it as in flight.
+
+        The task is awaited through asyncio.shield by every caller, so a cancelled
+        caller (even the one that started it) neither cancels the other waiters nor
+        discards the result.
+
+        Args:
+            user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
+            computation_key: Unique identifier for this computation
+            cache_key: Cache key the result is stored under
+            compute_fn: Callable that computes the value
+            ttl: Cache time-to-live in seconds
+
+        Returns:
+            Task computing and caching the value
+        """
+        task = asyncio.create_task(
+            self._compute_and_store(user_storage_key, computation_key, cache_key, compute_fn, ttl)
+        )
+        task.add_done_callback(self._mark_exception_retrieved)
+        self._in_flight[cache_key] = task
+        return task
+
+    async def _compute_and_store(
+        self,
+        user_storage_key: str,
+        computation_key: str,
+        cache_key: str,
+        compute_fn: Callable[[], T],
+        ttl: int,
+    ) -> T:
+        """Run a computation in the thread pool and cache its result.
 
+        Args:
+            user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
+            computation_key: Unique identifier for this computation
+            cache_key: Cache key the result is stored under
+            compute_fn: Callable that computes the value
+            ttl: Cache time-to-live in seconds
+
+        Returns:
+            Computed value
+        """
+        try:
+            try:
+                # to_thread also carries the caller's contextvars into the worker thread
+                result = await asyncio.to_thread(compute_fn)
+            except Exception as e:
+                # Direct fallback if there are thread pool issues (pickling errors, etc.)
+                logger.error(
+                    f"Thread pool execution failed for {computation_key}, falling back to direct execution: {e}"
+                )
+                result = compute_fn()
+        finally:
+            del self._in_flight[cache_key]
+
+        # The source data changed while computing: the result is stale, so neither cache
+        # it nor let it evict the entry for the current data
+        if cache_key != self._get_cache_key(user_storage_key, computation_key):
+            logger.debug(f"Source data changed while computing {computation_key}, not caching")
+            return result
+
+        # Cache the result, dropping entries computed from previous versions of the data
+        self._evict_superseded(user_storage_key, computation_key, cache_key)
+        self._cache[cache_key] = {"value": result, "timestamp": time.time(), "ttl": ttl}
         return result
 
+    @staticmethod
+    def _mark_exception_retrieved(task: asyncio.Task[Any]) -> None:
+        """Retrieve a failed computation's exception so it is not logged when nobody waits."""
+        if not task.cancelled():
+            task.exception()
+
+    def _evict_superseded(
+        self, user_storage_key: str, computation_key: str, cache_key: str
+    ) -> None:
+        """Remove entries of the same computation keyed by an older data hash.
+
+        Cache keys embed a hash of the source data, so a data change leaves the old
+        entry unreachable. Dropping it when the new one is stored keeps one entry per
+        computation instead of one per data version.
+
+        Args:
+            user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
+            computation_key: Unique identifier for this computation
+            cache_key: Cache key of the entry being stored
+        """
+        prefix = f"{user_storage_key}:{computation_key}:"
+        superseded = [key for key in self._cache if key.startswith(prefix) and key != cache_key]
+        for key in superseded:
+            del self._cache[key]
+        if superseded:
+            logger.debug(f"Evicted {len(superseded)} superseded entries for {computation_key}")
+
+    async def _refresh(
+        self,
+        user_storage_key: str,
+        computation_key: str,
+        cache_key: str,
+        compute_fn: Callable[[], Any],
+        ttl: int,
+    ) -> None:
+        """Recompute an expired cache entry in the background.
+
+        The entry is recomputed under the cache key it was served from when the refresh
+        was scheduled: compute_fn is built from that version of the data, so re-deriving
+        the key from storage here could file its result under a newer version.
+
+        Args:
+            user_storage_key: Key in app.storage.general (e.g., 'assets_sheet')
+            computation_key: Unique identifier for this computation
+            cache_key: Cache key of the expired entry
+            compute_fn: Callable that computes the value
+            ttl: Cache time-to-live in seconds
+        """
+        try:
+            task = self._in_flight.get(cache_key) or self._start_computation(
+                user_storage_key, computation_key, cache_key, compute_fn, ttl
+            )
+            await asyncio.shield(task)
+        except Exception as e:
+            # Keep serving the stale value; the next request retries the refresh
+            logger.error(f"Background refresh failed for {computation_key}: {e}")
+
     def invalidate_cache(self, pattern: str | None = None) -> None:
         """Invalidate cache entries matching a pattern or clear all cache.
 
@@ -112,6 +112,7 @@ class FinanceCalculator:
         self._processed_liabilities_df = None
         self._processed_incomes_df = None
         self._net_worth_df = None
+        self._expenses_last_12_months_df = None
 
     @property
     def processed_expenses_df(self) -> pd.DataFrame | None:
@@ -977,6 +978,27 @@ class FinanceCalculator:
 
         return result
 
+    def _get_expenses_last_12_months(self) -> pd.DataFrame:
+        """Get processed expenses of the last 12 months, cached after the first call.
+
+        The window starts on the first day of the month 11 months before the latest
+        expense date and ends on that date. Shared by the 12-month expense breakdowns
+        so the date filter runs once per calculator.
+
+        Returns:
+            Slice of the processed expenses DataFrame within the 12-month window
+        """
+        if self._expenses_last_12_months_df is None:
+            ef: pd.DataFrame = self.processed_expenses_df
+            latest_date: pd.Timestamp = ef[COL_DATE_DT].max()
+            start_date: pd.Timestamp = (
+                latest_date - pd.DateOffset(months=MONTHS_IN_YEAR - 1)
+            ).replace(day=1)
+            self._expenses_last_12_months_df = ef[
+                (ef[COL_DATE_DT] >= start_date) & (ef[COL_DATE_DT] <= latest_date)
+            ]
+        return self._expenses_last_12_months_df
+
     @track_performance("get_average_expenses_by_category_last_12_months")
     def get_average_expenses_by_category_last_12_months(self) -> dict[str, float]:
         """Get total expenses by category for last 12 months.
@@ -991,15 +1013,7 @@ class FinanceCalculator:
         if self.processed_expenses_df is None:
             return {}
 
-        ef: pd.DataFrame = self.processed_expenses_df
-        latest_date: pd.Timestamp = ef[COL_DATE_DT].max()
-        start_date: pd.Timestamp = (latest_date - pd.DateOffset(months=MONTHS_IN_YEAR - 1)).replace(
-            day=1
-        )
-
-        ef_last_12: pd.DataFrame = ef[
-            (ef[COL_DATE_DT] >= start_date) & (ef[COL_DATE_DT] <= latest_date)
-        ]
+        ef_last_12: pd.DataFrame = self._get_expenses_last_12_months()
         # Convert numpy scalars to float
         return {
             k: float(v)
@@ -1034,15 +1048,7 @@ class FinanceCalculator:
         ):
             return {}
 
-        ef: pd.DataFrame = self.processed_expenses_df
-        latest_date: pd.Timestamp = ef[COL_DATE_DT].max()
-        start_date: pd.Timestamp = (latest_date - pd.DateOffset(months=MONTHS_IN_YEAR - 1)).replace(
-            day=1
-        )
-
-        ef_last_12: pd.DataFrame = ef[
-            (ef[COL_DATE_DT] >= start_date) & (ef[COL_DATE_DT] <= latest_date)
-        ]
+        ef_last_12: pd.DataFrame = self._get_expenses_last_12_months()
 
         # Group by merchant and sum
         merchant_totals = (
@@ -1084,15 +1090,7 @@ class FinanceCalculator:
         if self.processed_expenses_df is None or COL_TYPE not in self.processed_expenses_df.columns:
             return {}
 
-        ef: pd.DataFrame = self.processed_expenses_df
-        latest_date: pd.Timestamp = ef[COL_DATE_DT].max()
-        start_date: pd.Timestamp = (latest_date - pd.DateOffset(months=MONTHS_IN_YEAR - 1)).replace(
-            day=1
-        )
-
-        ef_last_12: pd.DataFrame = ef[
-            (ef[COL_DATE_DT] >= start_date) & (ef[COL_DATE_DT] <= latest_date)
-        ]
+        ef_last_12: pd.DataFrame = self._get_expenses_last_12_months()
 
         # Convert numpy scalars to float
         return {
@@ -1269,6 +1267,26 @@ class FinanceCalculator:
             "last_valid_month": last_valid_month,
         }
 
+    @track_performance("get_expenses_aggregates")
+    def get_expenses_aggregates(self) -> dict[str, Any]:
+        """Get all expense breakdowns charted on the expenses page in one call.
+
+        Runs the year-over-year comparison and the 12-month breakdowns together so
+        they share the processed DataFrame and the 12-month window, and can be cached
+        as a single entry.
+
+        Returns:
+            Dictionary with:
+                - yoy: Result of get_expenses_yoy_comparison
+                - by_merchant: Result of get_expenses_by_merchant_last_12_months
+                - by_type: Result of get_expenses_by_type_last_12_months
+        """
+        return {
+            "yoy": self.get_expenses_yoy_comparison(),
+            "by_merchant": self.get_expenses_by_merchant_last_12_months(),
+            "by_type": self.get_expenses_by_type_last_12_months(),
+        }
+
     def get_unique_expense_fields(self) -> dict[str, list[str]]:
         """Get unique values for expense fields (merchants, categories, types).
 
@@ -20,13 +20,36 @@ import locale
 from collections.abc import Callable
 from contextlib import contextmanager
 from datetime import UTC, datetime
+from functools import lru_cache
 from io import StringIO
 from typing import Any, Literal
 
 import pandas as pd
 from user_agents import parse
 
-from app.core.currency_formats import get_currency_format, get_supported_currencies
+from app.core.currency_formats import (
+    CURRENCY_FORMATS,
+    CurrencyFormat,
+    get_currency_format,
+    get_supported_currencies,
+)
+
+
+def _build_separator_table(fmt: CurrencyFormat) -> dict[int, str]:
+    """Build a str.translate table mapping Python's ',' / '.' to the currency's separators."""
+    if fmt.thousands_sep == "." and fmt.decimal_sep == ",":
+        # European style: swap dot and comma
+        return str.maketrans({",": ".", ".": ","})
+    if fmt.thousands_sep == ".":
+        # Just replace thousands separator
+        return str.maketrans({",": "."})
+    return {}
+
+
+# Separator translation tables, built once at import for every supported currency
+_SEPARATOR_TABLES: dict[str, dict[int, str]] = {
+    code: _build_separator_table(fmt) for code, fmt in CURRENCY_FORMATS.items()
+}
 
 
 def get_or_store(dict: dict[str, Any], key: str, compute_fn: Callable[[], Any]) -> Any:
@@ -289,22 +312,9 @@ def format_currency(amount: float, currency: str | None = None, decimals: int =
     # Get currency format from centralized config
     fmt = get_currency_format(currency)
 
-    # Format with appropriate thousands separator and decimal places
-    # Python's format always uses comma for thousands and dot for decimals
-    formatted = f"{amount:,.{decimals}f}"
-
-    # Replace separators based on currency convention
-    if fmt.thousands_sep == "." and fmt.decimal_sep == ",":
-        # European style: swap dot and comma
-        # First replace comma (thousands) with temp marker
-        formatted = formatted.replace(",", "###TEMP###")
-        # Replace dot (decimal) with comma
-        formatted = formatted.replace(".", ",")
-        # Replace temp marker with dot (thousands)
-        formatted = formatted.replace("###TEMP###", ".")
-    elif fmt.thousands_sep == ".":
-        # Just replace thousands separator
-        formatted = formatted.replace(",", ".")
+    # Python's format always uses comma for thousands and dot for decimals;
+    # a single translate pass maps them to the currency's convention
+    formatted = f"{amount:,.{decimals}f}".translate(_SEPARATOR_TABLES[currency])
 
     # Position symbol based on currency convention (with space)
     if fmt.position == "before":
@@ -347,6 +357,17 @@ def _seconds_to_relative(seconds: int) -> str:
     return f"{months} month{'s' if months != 1 else ''} ago"
 
 
+@lru_cache(maxsize=8)
+def _parse_timestamp(timestamp_str: str) -> tuple[datetime, str]:
+    """Parse an ISO 8601 timestamp and its display format, memoized per string.
+
+    The last refresh timestamp is re-formatted on every timer tick while the
+    string itself rarely changes, so only the elapsed time is recomputed.
+    """
+    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+    return timestamp, timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
 def format_timestamp_relative(timestamp_str: str | None) -> tuple[str, str]:
     """Format timestamp with both absolute and relative time.
 
@@ -368,14 +389,36 @@ def format_timestamp_relative(timestamp_str: str | None) -> tuple[str, str]:
         return ("Never", "")
 
     try:
-        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        timestamp, formatted = _parse_timestamp(timestamp_str)
         seconds = int((datetime.now(UTC) - timestamp).total_seconds())
-        formatted = timestamp.strftime("%Y-%m-%d %H:%M:%S")
         return (formatted, _seconds_to_relative(seconds))
     except (ValueError, AttributeError):
         return ("Invalid timestamp", "")
 
 
+def get_timestamp_age_seconds(timestamp_str: str | None) -> int | None:
+    """Get the number of seconds elapsed since an ISO 8601 timestamp.
+
+    Args:
+        timestamp_str: ISO 8601 timestamp string, or None
+
+    Returns:
+        Elapsed seconds, or None if the timestamp is missing or invalid
+
+    Example:
+        >>> get_timestamp_age_seconds(get_current_timestamp())
+        0
+    """
+    if not timestamp_str:
+        return None
+
+    try:
+        timestamp, _ = _parse_timestamp(timestamp_str)
+    except (ValueError, AttributeError):
+        return None
+    return int((datetime.now(UTC) - timestamp).total_seconds())
+
+
 @contextmanager
 def sheet_service_from_json(credentials_json: str, workbook_url: str):
     """Create GoogleSheetService from JSON credentials string.
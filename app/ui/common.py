@@ -1,8 +1,10 @@
 """Common UI utilities and helpers."""
 
+from collections.abc import Callable
+from functools import cached_property, lru_cache
 from typing import Literal, NamedTuple
 
-from nicegui import app
+from nicegui import app, ui
 
 from app.core.currency_formats import get_currency_format, get_locale_for_currency
 from app.services import utils
@@ -41,7 +43,7 @@ def get_user_preferences() -> UserPreferences:
     user_agent: Literal["mobile", "desktop"] = "mobile" if user_agent_raw == "mobile" else "desktop"
 
     # Get user currency preference (from general storage - shared across devices)
-    user_currency = app.storage.general.get("currency", utils.get_user_currency())
+    user_currency = app.storage.general.get("currency") or utils.get_user_currency()
 
     # Get ECharts theme
     echart_theme = app.storage.general.get("echarts_theme_url") or ""
@@ -53,6 +55,35 @@ def get_user_preferences() -> UserPreferences:
     )
 
 
+class PageRenderer:
+    """Base class for page renderers, holding state shared by a page's components."""
+
+    @cached_property
+    def prefs(self) -> UserPreferences:
+        """User preferences, resolved once per page and shared by all components."""
+        return get_user_preferences()
+
+
+@lru_cache(maxsize=32)
+def navigate_to(path: str) -> Callable[[], None]:
+    """Get a click handler that navigates to the given page.
+
+    Handlers are memoized per path, so renders reuse the same function object
+    instead of creating a new lambda for every navigation link.
+
+    Args:
+        path: Page path to navigate to (e.g., pages.HOME_PAGE).
+
+    Returns:
+        Callable suitable for an element's click event.
+
+    Example:
+        >>> ui.element("a").on("click", navigate_to(pages.HOME_PAGE))
+    """
+    return lambda: ui.navigate.to(path)
+
+
+@lru_cache(maxsize=32)
 def get_aggrid_currency_formatter(currency: str) -> str:
     """Generate AG Grid valueFormatter JavaScript for user's currency.
 
@@ -60,6 +91,8 @@ def get_aggrid_currency_formatter(currency: str) -> str:
     monetary values according to the user's currency preferences, including
     proper locale, decimals, and symbol placement.
 
+    The result depends only on the currency, so it is memoized per currency.
+
     Args:
         currency: Currency code (EUR, USD, GBP, etc.).
 
@@ -1,9 +1,42 @@
-"""Reusable skeleton loader components for consistent loading states."""
+"""Reusable skeleton loader components for consistent loading states.
+
+Each loader is rendered as a single ``ui.html`` element holding static Quasar
+skeleton markup, instead of one ``ui.skeleton`` component per placeholder block.
+"""
 
 from nicegui import ui
 
 from app.ui import styles
 
+# Quasar skeleton classes/style (light variant, wave animation) as rendered by QSkeleton
+_SKELETON_BLOCK_HTML = (
+    '<div class="q-skeleton q-skeleton--light q-skeleton--type-rect '
+    'q-skeleton--anim q-skeleton--anim-wave {classes}" '
+    'style="--q-skeleton-speed: {speed_ms}ms"></div>'
+)
+
+
+def _skeleton_html(*block_classes: str) -> str:
+    """Build static markup for a stack of skeleton blocks.
+
+    Args:
+        *block_classes: Tailwind classes for each skeleton block, top to bottom
+
+    Returns:
+        HTML string with one skeleton div per block
+    """
+    speed_ms = int(styles.SKELETON_ANIMATION_SPEED * 1000)
+    return "".join(
+        _SKELETON_BLOCK_HTML.format(classes=classes, speed_ms=speed_ms) for classes in block_classes
+    )
+
+
+_KPI_CARD_SKELETON_HTML = _skeleton_html(
+    "w-24 h-4 rounded mb-2",  # Label (e.g., "Net Worth", "MoM Δ")
+    "w-32 h-8 rounded mb-2",  # Value (larger, prominent)
+    "w-full h-3 rounded",  # Description (full width)
+)
+
 
 def render_chart_skeleton(container: ui.element, title_width: str = "w-48") -> None:
     """Render skeleton loaders for a chart card.
@@ -21,14 +54,11 @@ def render_chart_skeleton(container: ui.element, title_width: str = "w-48") -> N
         >>> render_chart_skeleton(chart_container, title_width="w-64")
     """
     with container:
-        # Title skeleton
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            f"{title_width} h-6 rounded mb-4"
-        )
-        # Chart skeleton - h-96 for consistent chart height
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            "w-full h-96 rounded-lg"
-        )
+        # Title skeleton + chart skeleton (h-96 for consistent chart height)
+        ui.html(
+            _skeleton_html(f"{title_width} h-6 rounded mb-4", "w-full h-96 rounded-lg"),
+            sanitize=False,
+        ).classes("w-full")
 
 
 def render_kpi_card_skeleton(container: ui.element) -> None:
@@ -47,16 +77,7 @@ def render_kpi_card_skeleton(container: ui.element) -> None:
         >>> render_kpi_card_skeleton(kpi_card)
     """
     with container:
-        # Label skeleton (e.g., "Net Worth", "MoM Δ")
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            "w-24 h-4 rounded mb-2"
-        )
-        # Value skeleton (larger, prominent)
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            "w-32 h-8 rounded mb-2"
-        )
-        # Description skeleton (full width)
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes("w-full h-3 rounded")
+        ui.html(_KPI_CARD_SKELETON_HTML, sanitize=False).classes("w-full")
 
 
 def render_table_skeleton(container: ui.element, height: str = "h-96") -> None:
@@ -71,9 +92,7 @@ def render_table_skeleton(container: ui.element, height: str = "h-96") -> None:
         >>> render_table_skeleton(table_container, height="h-96")
     """
     with container:
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            f"w-full {height} rounded-lg"
-        )
+        ui.html(_skeleton_html(f"w-full {height} rounded-lg"), sanitize=False).classes("w-full")
 
 
 def render_large_chart_skeleton(container: ui.element, title_width: str = "w-64") -> None:
@@ -91,11 +110,8 @@ def render_large_chart_skeleton(container: ui.element, title_width: str = "w-64"
         >>> render_large_chart_skeleton(chart_container)
     """
     with container:
-        # Title skeleton
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            f"{title_width} h-8 rounded mb-4"
-        )
-        # Chart skeleton - flex-grow to fill remaining space
-        ui.skeleton(animation_speed=styles.SKELETON_ANIMATION_SPEED).classes(
-            "w-full flex-grow rounded-lg"
-        )
+        # Title skeleton + chart skeleton (flex-grow to fill remaining space)
+        ui.html(
+            _skeleton_html(f"{title_width} h-8 rounded mb-4", "w-full flex-grow rounded-lg"),
+            sanitize=False,
+        ).classes("w-full flex-grow flex flex-col")
@@ -4,6 +4,7 @@ This module provides utilities to standardize data loading patterns across pages
 eliminating duplication and ensuring consistent behavior.
 """
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 
@@ -16,27 +17,48 @@ from app.ui.rendering_utils import render_error_message
 logger = logging.getLogger(__name__)
 
 
+async def _render_concurrently(render_functions: list[Callable[[], Awaitable[None]]]) -> None:
+    """Run render functions concurrently within the caller's UI slot.
+
+    Each render function becomes its own task under asyncio.gather, so total latency
+    is that of the slowest component instead of the sum. Slot stacks are per task,
+    hence every task re-enters the caller's slot before rendering.
+
+    Args:
+        render_functions: Async functions rendering the page components
+    """
+    parent_slot = ui.context.slot
+
+    async def render_in_slot(render_fn: Callable[[], Awaitable[None]]) -> None:
+        with parent_slot:
+            await render_fn()
+
+    await asyncio.gather(*(render_in_slot(render_fn) for render_fn in render_functions))
+
+
 def render_with_data_loading(
     *,
     storage_keys: list[str],
     render_functions: list[Callable[[], Awaitable[None]]],
     error_container: ui.element,
     background_delay: float = 0.1,
-    render_delay: float = 0.5,
+    render_delay: float = 0.0,
 ) -> None:
     """Render page components with automatic data loading if needed.
 
     This utility consolidates the common pattern of:
     1. Check if required data is loaded in storage
     2. If not loaded: trigger background loading, then render on success
-    3. If already loaded: render immediately with timers
+    3. If already loaded: render immediately from a timer
 
     Args:
         storage_keys: List of app.storage.general keys to check (e.g., ["assets_sheet"])
         render_functions: List of async functions to call for rendering components
         error_container: UI element to show error messages in case of failure
         background_delay: Timer delay (seconds) before starting background loading (default: 0.1)
-        render_delay: Timer delay (seconds) before rendering when data already loaded (default: 0.5)
+        render_delay: Extra timer delay (seconds) before rendering when data already loaded
+            (default: 0.0). ui.timer already waits for the client connection, so the
+            skeleton is on screen before components render even without a delay
 
     Example:
         >>> containers = renderer.render_skeleton_ui()
@@ -61,9 +83,8 @@ def render_with_data_loading(
             try:
                 success = await ensure_data_loaded()
                 if success:
-                    # Data loaded successfully - render all components
-                    for render_fn in render_functions:
-                        await render_fn()
+                    # Data loaded successfully - render all components concurrently
+                    await _render_concurrently(render_functions)
                 else:
                     # Failed to load data - show error
                     render_error_message(error_container, ErrorMessages.INVALID_DATA_FORMAT)
@@ -83,6 +104,6 @@ def render_with_data_loading(
         # Start loading data asynchronously (non-blocking)
         ui.timer(background_delay, load_data_in_background, once=True)
     else:
-        # Data already loaded - render components immediately with timers
-        for render_fn in render_functions:
-            ui.timer(render_delay, render_fn, once=True)
+        # Data already loaded - render all components concurrently from a single timer.
+        # The timer starts once the client is connected (skeleton delivered), no fixed delay
+        ui.timer(render_delay, lambda: _render_concurrently(render_functions), once=True)
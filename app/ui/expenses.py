@@ -2,7 +2,7 @@
 
 import logging
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NamedTuple
 
 import pandas as pd
 from nicegui import app, ui
@@ -21,54 +21,283 @@ from app.core.state_manager import state_manager
 from app.logic.finance_calculator import FinanceCalculator
 from app.services import utils
 from app.ui import charts, header, styles
-from app.ui.common import get_aggrid_currency_formatter, get_user_preferences
+from app.ui.common import PageRenderer, get_aggrid_currency_formatter
 from app.ui.components.skeleton import render_chart_skeleton, render_table_skeleton
 from app.ui.data_loading import render_with_data_loading
 from app.ui.rendering_utils import render_no_data_message
 from app.ui.table_utils import create_csv_export_button, render_mobile_table_message
 
+# Columns shown in the transactions table (and exported to CSV)
+TABLE_COLUMNS = [COL_DATE, COL_MERCHANT, COL_AMOUNT_PARSED, COL_CATEGORY, COL_TYPE]
+
+# CSV export headers for the table columns
+EXPORT_COLUMNS = {
+    COL_DATE: "Date",
+    COL_MERCHANT: "Merchant",
+    COL_AMOUNT_PARSED: "Amount",
+    COL_CATEGORY: "Category",
+    COL_TYPE: "Type",
+}
+
+# AG Grid column definitions for the transactions table, built once at import time.
+# The amount column gets its currency valueFormatter at render time.
+GRID_COLUMN_DEFS: list[dict[str, Any]] = [
+    {
+        "field": COL_DATE,
+        "headerName": "Date",
+        "sortable": True,
+        "filter": "agDateColumnFilter",
+        "sort": "desc",  # Default sort descending
+        "flex": 1,
+        "minWidth": 120,
+        "valueFormatter": "value ? value.substring(0, 7) : ''",  # Display as YYYY-MM
+    },
+    {
+        "field": COL_MERCHANT,
+        "headerName": "Merchant",
+        "sortable": True,
+        "filter": "agTextColumnFilter",
+        "flex": 2,
+        "minWidth": 150,
+    },
+    {
+        "field": COL_AMOUNT_PARSED,
+        "headerName": "Amount",
+        "sortable": True,
+        "filter": "agNumberColumnFilter",
+        "type": "rightAligned",
+        "cellStyle": {"fontFamily": "monospace"},
+        "flex": 1,
+        "minWidth": 120,
+    },
+    {
+        "field": COL_CATEGORY,
+        "headerName": "Category",
+        "sortable": True,
+        "filter": "agTextColumnFilter",
+        "flex": 1,
+        "minWidth": 120,
+    },
+    {
+        "field": COL_TYPE,
+        "headerName": "Type",
+        "sortable": True,
+        "filter": "agSetColumnFilter",
+        "flex": 1,
+        "minWidth": 100,
+    },
+]
+
+GRID_DEFAULT_COL_DEF: dict[str, Any] = {
+    "resizable": True,
+    "sortable": True,
+    "filter": True,
+}
+
+
+class ChartSpec(NamedTuple):
+    """Static description of one expenses chart card.
+
+    Attributes:
+        container_key: Key of the chart card in the skeleton containers dict
+        title: Chart title to display
+        tooltip_text: Tooltip text for the chart
+        aggregate_key: Key of the chart data in the cached expenses aggregates
+        options_fn: Function creating ECharts options from (data, user_agent, currency)
+        validation_key: Optional key that must be non-empty in the data (e.g., "months")
+    """
+
+    container_key: str
+    title: str
+    tooltip_text: str
+    aggregate_key: str
+    options_fn: Callable[..., dict[str, Any]]
+    validation_key: str | None = None
+
+
+# Charts shown above the transactions table, left to right
+CHART_SPECS: tuple[ChartSpec, ...] = (
+    ChartSpec(
+        container_key="yoy_chart_container",
+        title="Year-over-Year Expenses",
+        tooltip_text="Cumulative + Forecast until EoY",
+        aggregate_key="yoy",
+        options_fn=charts.create_expenses_yoy_comparison_options,
+        validation_key="months",
+    ),
+    ChartSpec(
+        container_key="merchant_chart_container",
+        title="Expenses by Merchant",
+        tooltip_text="Expenses of last 12 months",
+        aggregate_key="by_merchant",
+        options_fn=charts.create_expenses_by_merchant_options,
+    ),
+    ChartSpec(
+        container_key="type_chart_container",
+        title="Expenses by Type",
+        tooltip_text="Expenses of last 12 months",
+        aggregate_key="by_type",
+        options_fn=charts.create_expenses_by_type_options,
+    ),
+)
+
+
+def build_expenses_table_data(processed_df: pd.DataFrame) -> dict[str, Any]:
+    """Build the cached expenses table payload from the processed expenses DataFrame.
+
+    Args:
+        processed_df: Processed expenses DataFrame (FinanceCalculator.processed_expenses_df)
+
+    Returns:
+        Dictionary with 'rows' (AG Grid row objects), 'export_df' (displayed columns,
+        for CSV export) and 'total_count'
+    """
+    # Keep only the displayed columns: helper columns (e.g. Date_DT) are neither
+    # shown nor exported, so they are not converted or cached
+    df_table = processed_df[[col for col in TABLE_COLUMNS if col in processed_df]]
+
+    # Date is the only displayed column that can be datetime (e.g. sheets loaded
+    # from Google Sheets): convert it to ISO date strings for JSON serialization
+    # with one vectorized strftime instead of str() per cell
+    if pd.api.types.is_datetime64_any_dtype(df_table[COL_DATE]):
+        df_table = df_table.assign(**{COL_DATE: df_table[COL_DATE].dt.strftime("%Y-%m-%d")})
+
+    # Quantize amounts to cents: parsing artifacts such as 1234.5600000001
+    # serialize as short JSON numbers and filters/sorting see exact cent values
+    df_table = df_table.assign(**{COL_AMOUNT_PARSED: df_table[COL_AMOUNT_PARSED].round(2)})
+
+    # Build AG Grid rows once here so they are cached with the computation:
+    # zip the displayed columns as plain lists (no per-cell boxing of
+    # to_dict("records"))
+    total_count = len(df_table)
+    columns = {
+        col: df_table[col].tolist() if col in df_table.columns else [""] * total_count
+        for col in TABLE_COLUMNS
+    }
+    rows = [
+        {
+            COL_DATE: date_str,  # Keep full date (YYYY-MM-DD) for proper filtering
+            COL_MERCHANT: merchant,
+            COL_AMOUNT_PARSED: amount_value,
+            COL_CATEGORY: category,
+            COL_TYPE: expense_type,
+        }
+        for date_str, merchant, amount_value, category, expense_type in zip(
+            *(columns[col] for col in TABLE_COLUMNS), strict=True
+        )
+    ]
 
-class ExpensesRenderer:
+    return {
+        "rows": rows,
+        # Kept for CSV export: columns are selected and renamed while writing
+        "export_df": df_table,
+        "total_count": total_count,
+    }
+
+
+class ExpensesRenderer(PageRenderer):
     """Expenses page renderer with table and charts."""
 
+    def __init__(self):
+        """Initialize ExpensesRenderer with no expenses sheet read yet."""
+        self._expenses_sheet_str: str | None = None
+
+    def _get_expenses_sheet(self) -> str | None:
+        """Get the expenses sheet JSON string, reading general storage once per page.
+
+        Only a present sheet is remembered: when the page renders before the
+        background data load completes, the components read it again afterwards.
+
+        The remembered string only decides which data version this page shows: every
+        cache entry is keyed on the string it is built from, and results for a sheet
+        replaced since are not cached.
+
+        Returns:
+            Expenses sheet JSON string, or None if not loaded
+        """
+        if not self._expenses_sheet_str:
+            self._expenses_sheet_str = app.storage.general.get("expenses_sheet")
+        return self._expenses_sheet_str
+
+    async def _get_calculator(self, expenses_sheet_str: str) -> FinanceCalculator:
+        """Get the FinanceCalculator for the expenses sheet, shared by all page sections.
+
+        The sheet is parsed and preprocessed once per data version; the table and the
+        charts then run their aggregations on the same cached calculator. This and the
+        entries derived from it are keyed on the sheet string they are built from, so a
+        refresh landing mid-render cannot file old results under the new sheet.
+
+        Args:
+            expenses_sheet_str: Expenses sheet JSON string from general storage
+
+        Returns:
+            FinanceCalculator with the processed expenses DataFrame ready
+        """
+
+        def build_calculator() -> FinanceCalculator:
+            calculator = FinanceCalculator(expenses_df=utils.read_json(expenses_sheet_str))
+            # Preprocess eagerly so concurrent readers never race on the lazy property
+            _ = calculator.processed_expenses_df
+            return calculator
+
+        return await state_manager.get_or_compute(
+            user_storage_key="expenses_sheet",
+            computation_key="expenses_calculator_v1",
+            compute_fn=build_calculator,
+            ttl_seconds=CACHE_TTL_SECONDS,
+            stale_ok=True,
+            source_data=expenses_sheet_str,
+        )
+
+    async def _get_aggregates(self, expenses_sheet_str: str) -> dict[str, Any]:
+        """Get the cached chart aggregates, computed together in a single pass.
+
+        Args:
+            expenses_sheet_str: Expenses sheet JSON string from general storage
+
+        Returns:
+            Dictionary from FinanceCalculator.get_expenses_aggregates
+        """
+        calculator = await self._get_calculator(expenses_sheet_str)
+        return await state_manager.get_or_compute(
+            user_storage_key="expenses_sheet",
+            computation_key="expenses_aggregates_v2",
+            compute_fn=calculator.get_expenses_aggregates,
+            ttl_seconds=CACHE_TTL_SECONDS,
+            stale_ok=True,
+            source_data=expenses_sheet_str,
+        )
+
     async def load_expenses_data(self) -> dict[str, Any] | None:
-        """Load and cache expenses data from financial records."""
+        """Load and cache expenses data from financial records.
+
+        Amounts are shipped as raw numbers: the AG Grid ``valueFormatter`` formats them
+        client-side, so the cached payload does not depend on the user currency.
+
+        Returns:
+            Dictionary with 'rows', 'export_df' and 'total_count', or None
+        """
         try:
-            expenses_sheet_str = app.storage.general.get("expenses_sheet")
+            expenses_sheet_str = self._get_expenses_sheet()
             if not expenses_sheet_str:
                 return None
 
-            def compute_expenses_data():
-                expenses_sheet = utils.read_json(expenses_sheet_str)
-                calculator = FinanceCalculator(expenses_df=expenses_sheet)
+            calculator = await self._get_calculator(expenses_sheet_str)
 
+            def compute_expenses_data():
                 # Get processed expenses DataFrame
                 processed_df = calculator.processed_expenses_df
                 if processed_df is None:
                     return None
-
-                # Convert to list of dicts for easier rendering
-                # Convert all datetime/Timestamp columns to strings for JSON serialization
-                df_copy = processed_df.copy()
-                for col in df_copy.columns:
-                    if df_copy[col].dtype == "datetime64[ns]":
-                        df_copy[col] = df_copy[col].astype(str)
-                transactions = df_copy.to_dict("records")
-
-                # Get category totals
-                category_totals = calculator.get_average_expenses_by_category_last_12_months()
-
-                return {
-                    "transactions": transactions,
-                    "category_totals": category_totals,
-                    "total_count": len(transactions),
-                }
+                return build_expenses_table_data(processed_df)
 
             return await state_manager.get_or_compute(
                 user_storage_key="expenses_sheet",
-                computation_key="expenses_data_v3",
+                computation_key="expenses_rows_v4",
                 compute_fn=compute_expenses_data,
                 ttl_seconds=CACHE_TTL_SECONDS,
+                stale_ok=True,
+                source_data=expenses_sheet_str,
             )
         except Exception as e:
             logger = logging.getLogger(__name__)
@@ -77,17 +306,26 @@ class ExpensesRenderer:
 
     async def render_expenses_table(self, container: ui.column) -> None:
         """Render expenses transaction table with all data."""
+        prefs = self.prefs
+
+        # Tables are not shown on phones: skip loading rows and building the grid
+        if prefs.user_agent == "mobile":
+            container.clear()
+            async with container:
+                render_mobile_table_message(hide_on_desktop=False)
+            return
+
+        # Get user currency preference (from general storage - shared across devices)
+        user_currency = prefs.currency
+
         expenses_data = await self.load_expenses_data()
         container.clear()
 
-        if not expenses_data or not expenses_data.get("transactions"):
+        if not expenses_data or not expenses_data.get("total_count"):
             async with container:
                 ui.label("No expenses data available").classes("text-center text-gray-500 py-8")
             return
 
-        # Get user currency preference (from general storage - shared across devices)
-        user_currency: str = app.storage.general.get("currency", utils.get_user_currency())
-
         # Mobile-only message (hidden on desktop/tablet)
         async with container:
             render_mobile_table_message()
@@ -101,117 +339,42 @@ class ExpensesRenderer:
                     )
 
                     with ui.row().classes("gap-2 items-center"):
-                        # Global search input
+                        # Global search input (debounced: only the settled value is sent)
                         search_input = (
                             ui.input(placeholder="Search all fields...")
                             .classes("w-64")
-                            .props("outlined dense")
+                            .props('outlined dense debounce="150"')
                         )
 
-                        # CSV Export button - prepare DataFrame with renamed columns
-                        df_export = pd.DataFrame(expenses_data["transactions"])
-                        export_columns = {
-                            COL_DATE: "Date",
-                            COL_MERCHANT: "Merchant",
-                            COL_AMOUNT_PARSED: "Amount",
-                            COL_CATEGORY: "Category",
-                            COL_TYPE: "Type",
-                        }
-                        df_export = df_export[list(export_columns.keys())].copy()
-                        df_export.columns = list(export_columns.values())
-
-                        create_csv_export_button(df_export, "kanso_expenses")
-
-                # Prepare data for AG Grid
-                rows = []
-                for transaction in expenses_data["transactions"]:
-                    # Format amount with currency for display (with 2 decimals)
-                    amount_value = transaction.get(COL_AMOUNT_PARSED, 0)
-                    formatted_amount = utils.format_currency(
-                        amount_value, user_currency, decimals=2
-                    )
-
-                    # Keep full date for filtering, will format for display in column config
-                    date_str = transaction.get(COL_DATE, "")
-
-                    rows.append(
-                        {
-                            COL_DATE: date_str,  # Keep full date (YYYY-MM-DD) for proper filtering
-                            COL_MERCHANT: transaction.get(COL_MERCHANT, ""),
-                            COL_AMOUNT_PARSED: amount_value,
-                            "amount_display": formatted_amount,
-                            COL_CATEGORY: transaction.get(COL_CATEGORY, ""),
-                            COL_TYPE: transaction.get(COL_TYPE, ""),
-                        }
-                    )
+                        # CSV Export button - reuses the cached export DataFrame
+                        create_csv_export_button(
+                            expenses_data["export_df"],
+                            "kanso_expenses",
+                            column_names=EXPORT_COLUMNS,
+                        )
 
-                # Get currency formatter for amount column
+                # Static column definitions, with the currency formatter on the amount column
                 amount_formatter = get_aggrid_currency_formatter(user_currency)
+                column_defs = [
+                    {**col, "valueFormatter": amount_formatter}
+                    if col["field"] == COL_AMOUNT_PARSED
+                    else col
+                    for col in GRID_COLUMN_DEFS
+                ]
 
                 # AG Grid configuration
                 aggrid = ui.aggrid(
                     options={
-                        "columnDefs": [
-                            {
-                                "field": COL_DATE,
-                                "headerName": "Date",
-                                "sortable": True,
-                                "filter": "agDateColumnFilter",
-                                "sort": "desc",  # Default sort descending
-                                "flex": 1,
-                                "minWidth": 120,
-                                "valueFormatter": "value ? value.substring(0, 7) : ''",  # Display as YYYY-MM
-                            },
-                            {
-                                "field": COL_MERCHANT,
-                                "headerName": "Merchant",
-                                "sortable": True,
-                                "filter": "agTextColumnFilter",
-                                "flex": 2,
-                                "minWidth": 150,
-                            },
-                            {
-                                "field": COL_AMOUNT_PARSED,
-                                "headerName": "Amount",
-                                "sortable": True,
-                                "filter": "agNumberColumnFilter",
-                                "type": "rightAligned",
-                                "cellStyle": {"fontFamily": "monospace"},
-                                "flex": 1,
-                                "minWidth": 120,
-                                "valueFormatter": amount_formatter,
-                            },
-                            {
-                                "field": COL_CATEGORY,
-                                "headerName": "Category",
-                                "sortable": True,
-                                "filter": "agTextColumnFilter",
-                                "flex": 1,
-                                "minWidth": 120,
-                            },
-                            {
-                                "field": COL_TYPE,
-                                "headerName": "Type",
-                                "sortable": True,
-                                "filter": "agSetColumnFilter",
-                                "flex": 1,
-                                "minWidth": 100,
-                            },
-                        ],
-                        "rowData": rows,
-                        "defaultColDef": {
-                            "resizable": True,
-                            "sortable": True,
-                            "filter": True,
-                        },
+                        "columnDefs": column_defs,
+                        "rowData": expenses_data["rows"],
+                        "defaultColDef": GRID_DEFAULT_COL_DEF,
                         "pagination": True,
                         "paginationPageSize": AGGRID_PAGE_SIZE_DEFAULT,
                         "paginationPageSizeSelector": AGGRID_PAGE_SIZE_OPTIONS,
-                        "domLayout": "autoHeight",
                     },
                     theme="quartz",
                     auto_size_columns=False,
-                ).classes("w-full")
+                ).classes("w-full h-[600px]")  # Fixed height keeps row virtualization active
 
                 # Connect search input to AG Grid quick filter
                 search_input.on(
@@ -221,132 +384,80 @@ class ExpensesRenderer:
                     ),
                 )
 
-    async def _render_chart_generic(
-        self,
-        container: ui.card,
-        title: str,
-        tooltip_text: str,
-        computation_key: str,
-        compute_fn: Callable[[Any], Any],
-        chart_options_fn: Callable[..., dict[str, Any]],
-        data_validation_key: str | None = None,
-    ) -> None:
-        """Generic chart rendering with common logic extracted.
-
-        Consolidates the repeated pattern of:
+    async def render_chart(self, spec: ChartSpec, container: ui.card) -> None:
+        """Render one expenses chart card from its spec.
+
+        Consolidates the common pattern of:
         - Clearing container
         - Loading data from storage
-        - Computing/caching results
+        - Reading this chart's slice of the cached aggregates
         - Getting user preferences
+        - Building (or reusing cached) chart options
         - Rendering chart or error message
 
         Args:
+            spec: Chart description (title, tooltip, aggregate key, options builder)
             container: UI card container to render into
-            title: Chart title to display
-            tooltip_text: Tooltip text for the chart
-            computation_key: Cache key for state_manager
-            compute_fn: Function to compute chart data (receives expenses sheet)
-            chart_options_fn: Function to create ECharts options
-            data_validation_key: Optional key to validate data exists (e.g., "months")
         """
         container.clear()
 
-        # Load expenses sheet from storage
-        expenses_sheet_str = app.storage.general.get("expenses_sheet")
+        # Load expenses sheet (read from storage once per page)
+        expenses_sheet_str = self._get_expenses_sheet()
         if not expenses_sheet_str:
-            render_no_data_message(container, title, tooltip_text)
+            render_no_data_message(container, spec.title, spec.tooltip_text)
             return
 
-        # Compute or retrieve cached data
-        def compute_wrapper():
-            expenses_sheet = utils.read_json(expenses_sheet_str)
-            calculator = FinanceCalculator(expenses_df=expenses_sheet)
-            return compute_fn(calculator)
-
-        data = await state_manager.get_or_compute(
-            user_storage_key="expenses_sheet",
-            computation_key=computation_key,
-            compute_fn=compute_wrapper,
-            ttl_seconds=CACHE_TTL_SECONDS,
-        )
+        # Compute or retrieve cached data (one shared entry for all charts)
+        aggregates = await self._get_aggregates(expenses_sheet_str)
+        data = aggregates[spec.aggregate_key]
 
         # Validate data
-        if not data or (data_validation_key and not data.get(data_validation_key)):
-            render_no_data_message(container, title, tooltip_text)
+        if not data or (spec.validation_key and not data.get(spec.validation_key)):
+            render_no_data_message(container, spec.title, spec.tooltip_text)
             return
 
-        # Get user preferences using centralized utility
-        prefs = get_user_preferences()
+        # Get user preferences (resolved once per page)
+        prefs = self.prefs
 
-        # Create chart options
-        options = chart_options_fn(data, prefs.user_agent, prefs.currency)
+        # Create chart options, cached per layout and currency alongside the aggregates
+        options = await state_manager.get_or_compute(
+            user_storage_key="expenses_sheet",
+            computation_key=(
+                f"expenses_{spec.aggregate_key}_options_{prefs.user_agent}_{prefs.currency}"
+            ),
+            compute_fn=lambda: spec.options_fn(data, prefs.user_agent, prefs.currency),
+            ttl_seconds=CACHE_TTL_SECONDS,
+            stale_ok=True,
+            source_data=expenses_sheet_str,
+        )
 
         # Render chart
         async with container:
-            ui.label(title).classes(styles.CHART_CARDS_LABEL_CLASSES)
-            ui.tooltip(tooltip_text)
+            ui.label(spec.title).classes(styles.CHART_CARDS_LABEL_CLASSES)
+            ui.tooltip(spec.tooltip_text)
             ui.echart(options=options, theme=prefs.echart_theme).classes("h-96 w-full")
 
-    async def render_yoy_chart(self, container: ui.card) -> None:
-        """Render year-over-year expenses comparison chart."""
-        await self._render_chart_generic(
-            container=container,
-            title="Year-over-Year Expenses",
-            tooltip_text="Cumulative + Forecast until EoY",
-            computation_key="expenses_yoy_comparison_v2",
-            compute_fn=lambda calc: calc.get_expenses_yoy_comparison(),
-            chart_options_fn=charts.create_expenses_yoy_comparison_options,
-            data_validation_key="months",
-        )
-
-    async def render_merchant_chart(self, container: ui.card) -> None:
-        """Render expenses by merchant donut chart."""
-        await self._render_chart_generic(
-            container=container,
-            title="Expenses by Merchant",
-            tooltip_text="Expenses of last 12 months",
-            computation_key="expenses_by_merchant_v1",
-            compute_fn=lambda calc: calc.get_expenses_by_merchant_last_12_months(),
-            chart_options_fn=charts.create_expenses_by_merchant_options,
-        )
-
-    async def render_type_chart(self, container: ui.card) -> None:
-        """Render expenses by type donut chart."""
-        await self._render_chart_generic(
-            container=container,
-            title="Expenses by Type",
-            tooltip_text="Expenses of last 12 months",
-            computation_key="expenses_by_type_v1",
-            compute_fn=lambda calc: calc.get_expenses_by_type_last_12_months(),
-            chart_options_fn=charts.create_expenses_by_type_options,
-        )
-
     def render_skeleton_ui(self) -> dict[str, Any]:
         """Render skeleton UI structure with loading placeholders."""
+        containers: dict[str, Any] = {}
         with ui.column().classes("w-full max-w-screen-xl mx-auto p-4 space-y-5 main-content"):
-            # Row with 3 chart containers
+            # Row with one chart container per chart spec
             with ui.row().classes("grid grid-cols-1 lg:grid-cols-3 gap-4 w-full"):
-                yoy_chart_container = ui.card().classes(styles.CHART_CARDS_CLASSES)
-                merchant_chart_container = ui.card().classes(styles.CHART_CARDS_CLASSES)
-                type_chart_container = ui.card().classes(styles.CHART_CARDS_CLASSES)
+                for spec in CHART_SPECS:
+                    containers[spec.container_key] = ui.card().classes(styles.CHART_CARDS_CLASSES)
 
             # Table container
             table_container = ui.column().classes("w-full")
 
         # Initialize chart containers with skeletons
-        render_chart_skeleton(yoy_chart_container)
-        render_chart_skeleton(merchant_chart_container)
-        render_chart_skeleton(type_chart_container)
+        for spec in CHART_SPECS:
+            render_chart_skeleton(containers[spec.container_key])
 
         # Initialize table container with skeleton
         render_table_skeleton(table_container)
 
-        return {
-            "yoy_chart_container": yoy_chart_container,
-            "merchant_chart_container": merchant_chart_container,
-            "type_chart_container": type_chart_container,
-            "table_container": table_container,
-        }
+        containers["table_container"] = table_container
+        return containers
 
 
 def render() -> None:
@@ -362,9 +473,10 @@ def render() -> None:
     render_with_data_loading(
         storage_keys=["expenses_sheet"],
         render_functions=[
-            lambda: renderer.render_yoy_chart(containers["yoy_chart_container"]),
-            lambda: renderer.render_merchant_chart(containers["merchant_chart_container"]),
-            lambda: renderer.render_type_chart(containers["type_chart_container"]),
+            *(
+                lambda spec=spec: renderer.render_chart(spec, containers[spec.container_key])
+                for spec in CHART_SPECS
+            ),
             lambda: renderer.render_expenses_table(containers["table_container"]),
         ],
         error_container=containers["table_container"],
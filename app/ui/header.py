@@ -1,85 +1,135 @@
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
 from nicegui import app, ui
+from nicegui.timer import Timer
 
 from app.services import pages
-from app.services.utils import format_timestamp_relative
+from app.services.utils import format_timestamp_relative, get_timestamp_age_seconds
 from app.ui import styles
+from app.ui.common import navigate_to
 from app.ui.styles import HEADER_BUTTON_PROPS
 
+logger = logging.getLogger(__name__)
 
-def render_last_refresh_timestamp() -> None:
-    """Render last data refresh timestamp at the bottom of sidebar with auto-refresh.
+# Sidebar timestamp containers of open pages with their update callbacks, all driven
+# by a single process-wide timer (the timestamp is global, not per user)
+_timestamp_subscribers: dict[ui.column, Callable[[tuple[str, str] | None], None]] = {}
+_timestamp_timer: Timer | None = None
 
-    Only shows the timestamp section when data has been loaded at least once.
+# Last refresh value last pushed to subscribers and when its relative time is next due
+_timestamp_state: dict[str, Any] = {"last_refresh": None, "next_format_at": 0.0}
+
+
+def _next_check_interval(age_seconds: int | None) -> float:
+    """Get the delay before an unchanged last refresh is formatted again.
+
+    Re-formats quickly until the refresh is a minute old, then backs off as the
+    relative time ("5 minutes ago", "2 hours ago") changes less often. A new
+    refresh is picked up on the next timer tick regardless of this delay.
+
+    Args:
+        age_seconds: Age of the last refresh in seconds, or None if there is none yet
+
+    Returns:
+        Delay in seconds
     """
-    # Container that will hold the timestamp UI (or stay empty) - compact spacing
-    container = ui.column().classes("w-full mt-auto pt-2")
+    if age_seconds is None or age_seconds < 60:
+        return 5.0
+    if age_seconds < 3600:
+        return 60.0
+    return 300.0
 
-    # Track if UI has been rendered
-    ui_rendered = {"value": False}
 
-    def check_and_render():
-        """Check if timestamp exists and render/update UI accordingly."""
-        last_refresh = app.storage.general.get("last_data_refresh")
+def _get_last_refresh_display(last_refresh: str | None) -> tuple[str, str] | None:
+    """Format the last refresh timestamp, or return None if data was never loaded."""
+    return format_timestamp_relative(last_refresh) if last_refresh else None
 
-        if not last_refresh:
-            # No timestamp yet - keep container empty
-            container.clear()
-            ui_rendered["value"] = False
-            return
 
-        # Timestamp exists - render or update UI
-        if not ui_rendered["value"]:
-            # First time rendering - create UI structure
-            with container:
-                ui.separator().classes("mb-1")
-                # Title with clock icon - compact
-                with ui.row().classes("items-center gap-1 mt-1"):
-                    ui.html(styles.CLOCK_SVG, sanitize=False).classes("text-base-content/70")
-                    ui.label("Last Data Refresh").classes(
-                        "text-xs font-semibold text-base-content/70"
-                    )
-
-                # Single label showing relative time
-                container.timestamp_label = ui.label().classes(
-                    "text-xs text-base-content/60 italic"
-                )
-
-            ui_rendered["value"] = True
-
-        # Update timestamp values
-        formatted, relative = format_timestamp_relative(last_refresh)
-
-        # Show relative time, with full datetime in tooltip
+def _update_timestamp_subscribers() -> None:
+    """Update every open sidebar timestamp when the last refresh or its relative time changes.
+
+    The raw storage value is compared on every tick, so a new refresh shows up
+    within one tick; an unchanged value is only re-formatted after
+    _next_check_interval. Containers of closed pages are dropped on every tick.
+    """
+    # Page closed: stop tracking its container (and the elements its callback holds)
+    for container in [c for c in _timestamp_subscribers if c.is_deleted]:
+        del _timestamp_subscribers[container]
+
+    last_refresh = app.storage.general.get("last_data_refresh")
+    now = time.monotonic()
+    if (
+        last_refresh == _timestamp_state["last_refresh"]
+        and now < _timestamp_state["next_format_at"]
+    ):
+        return
+    _timestamp_state["last_refresh"] = last_refresh
+    _timestamp_state["next_format_at"] = now + _next_check_interval(
+        get_timestamp_age_seconds(last_refresh)
+    )
+
+    display = _get_last_refresh_display(last_refresh)
+    for update in list(_timestamp_subscribers.values()):
         try:
-            if relative:
-                container.timestamp_label.set_text(relative)
-                # Only update tooltip if it doesn't exist yet or text changed
-                if (
-                    not hasattr(container.timestamp_label, "_tooltip_text")
-                    or container.timestamp_label._tooltip_text != formatted
-                ):
-                    container.timestamp_label.tooltip(formatted)
-                    container.timestamp_label._tooltip_text = formatted
-            else:
-                # Fallback if no relative time
-                container.timestamp_label.set_text(formatted)
-                if (
-                    not hasattr(container.timestamp_label, "_tooltip_text")
-                    or container.timestamp_label._tooltip_text != ""
-                ):
-                    container.timestamp_label.tooltip("")
-                    container.timestamp_label._tooltip_text = ""
+            update(display)
         except Exception:
-            # Client has been disconnected, timer will be cleaned up automatically
-            pass
+            # Keep updating the other pages (disconnected ones are dropped once deleted)
+            logger.exception("Failed to update the sidebar last refresh timestamp")
 
-    # Initial check
-    check_and_render()
 
-    # Auto-refresh every 5 seconds to:
-    # 1. Detect when timestamp becomes available (first load)
-    # 2. Keep relative time updated ("2 minutes ago" -> "3 minutes ago")
-    ui.timer(5.0, check_and_render)
+def render_last_refresh_timestamp() -> None:
+    """Render last data refresh timestamp at the bottom of sidebar with auto-refresh.
+
+    Only shows the timestamp section when data has been loaded at least once.
+    Updates come from one shared timer for all open pages.
+    """
+    global _timestamp_timer
+
+    # Container holding the timestamp UI, built once and hidden until data has been
+    # loaded at least once - compact spacing
+    with ui.column().classes("w-full mt-auto pt-2") as container:
+        ui.separator().classes("mb-1")
+        # Title with clock icon - compact
+        with ui.row().classes("items-center gap-1 mt-1"):
+            ui.html(styles.CLOCK_SVG, sanitize=False).classes("text-base-content/70")
+            ui.label("Last Data Refresh").classes("text-xs font-semibold text-base-content/70")
+
+        # Single label showing relative time, with the full datetime in its tooltip.
+        # Both are created here: updates come from the shared timer, which runs outside
+        # any page slot and can only change existing elements
+        with ui.label().classes("text-xs text-base-content/60 italic") as timestamp_label:
+            timestamp_tooltip = ui.tooltip()
+
+    # Last displayed (formatted, relative) values
+    displayed: dict[str, tuple[str, str] | None] = {"value": None}
+
+    def update(display: tuple[str, str] | None) -> None:
+        """Show/update the timestamp UI for the given (formatted, relative) values."""
+        # Hidden while there is no timestamp yet
+        container.set_visibility(display is not None)
+
+        # Skip the UI update when nothing visible changed
+        if display is None or displayed["value"] == display:
+            return
+        displayed["value"] = display
+        formatted, relative = display
+
+        # Show relative time, with full datetime in tooltip (fallback: formatted time only)
+        timestamp_label.set_text(relative or formatted)
+        timestamp_tooltip.set_text(formatted if relative else "")
+
+    # Initial render
+    update(_get_last_refresh_display(app.storage.general.get("last_data_refresh")))
+
+    # Subscribe to the shared 5-second auto-refresh timer, which:
+    # 1. Detects when timestamp becomes available (first load)
+    # 2. Keeps relative time updated ("2 minutes ago" -> "3 minutes ago")
+    _timestamp_subscribers[container] = update
+    if _timestamp_timer is None:
+        _timestamp_timer = app.timer(5.0, _update_timestamp_subscribers, immediate=False)
 
 
 def render() -> None:
@@ -91,7 +141,7 @@ def render() -> None:
             with ui.element("ul").classes("menu w-full"):
                 # Dashboard - main entry point
                 with ui.element("li"):
-                    with ui.element("a").on("click", lambda: ui.navigate.to(pages.HOME_PAGE)):
+                    with ui.element("a").on("click", navigate_to(pages.HOME_PAGE)):
                         ui.html(styles.HOME_SVG, sanitize=False)
                         ui.label("Dashboard")
 
@@ -103,15 +153,11 @@ def render() -> None:
                             ui.label("Insights")
                         with ui.element("ul"):
                             with ui.element("li"):
-                                with ui.element("a").on(
-                                    "click", lambda: ui.navigate.to(pages.NET_WORTH_PAGE)
-                                ):
+                                with ui.element("a").on("click", navigate_to(pages.NET_WORTH_PAGE)):
                                     ui.html(styles.NET_WORTH_SVG, sanitize=False)
                                     ui.label("Net Worth")
                             with ui.element("li"):
-                                with ui.element("a").on(
-                                    "click", lambda: ui.navigate.to(pages.EXPENSES_PAGE)
-                                ):
+                                with ui.element("a").on("click", navigate_to(pages.EXPENSES_PAGE)):
                                     ui.html(styles.EXPENSES_SVG, sanitize=False)
                                     ui.label("Expenses")
 
@@ -123,53 +169,33 @@ def render() -> None:
                 ui.separator().classes("mb-2")
                 with ui.element("ul").classes("menu w-full p-0"):
                     with ui.element("li"):
-                        with ui.element("a").on(
-                            "click", lambda: ui.navigate.to(pages.SETTINGS_PAGE)
-                        ):
+                        with ui.element("a").on("click", navigate_to(pages.SETTINGS_PAGE)):
                             ui.html(styles.SETTINGS_SVG, sanitize=False)
                             ui.label("Settings")
 
                 # Last refresh timestamp at very bottom
                 render_last_refresh_timestamp()
 
-    # Header desktop
-    with ui.header().classes("bg-secondary p-2 mobile-hide"):
-        with ui.row().classes("w-full items-center gap-4"):
-            # Hamburger menu icon (toggle drawer)
-            hamburger = ui.button(icon="menu").props(HEADER_BUTTON_PROPS)
-            hamburger.on("click", left_drawer.toggle)
-
-            # Logo Kanso (clickable to go home)
-            with ui.link(target=pages.HOME_PAGE).classes("no-underline"):
-                ui.html(styles.LOGO_SVG, sanitize=False)
-
-            # Spacer to push Add button to the right
-            ui.space()
-
-            # Quick add expense button (desktop: icon + text)
-            with ui.link(target="/quick-add").classes("no-underline"):
-                with ui.button().props(HEADER_BUTTON_PROPS):
-                    ui.html(styles.ADD_SVG, sanitize=False)
-                    ui.label("Add").classes("ml-1")
-                ui.tooltip("Add Expense")
-
-    # Header mobile
-    with ui.header().classes("bg-secondary p-2 md:hidden"):
-        with ui.row().classes("w-full items-center relative"):
+    # Header (responsive: on mobile the logo is centered and the Add button is icon only)
+    with ui.header().classes("bg-secondary p-2"):
+        with ui.row().classes("w-full items-center gap-4 relative"):
             # Hamburger menu icon (toggle drawer) - left side
             hamburger = ui.button(icon="menu").props(HEADER_BUTTON_PROPS)
             hamburger.on("click", left_drawer.toggle)
 
-            # Logo Kanso (clickable to go home) - absolutely centered
-            with ui.element("div").classes("absolute left-1/2 -translate-x-1/2"):
+            # Logo Kanso (clickable to go home) - absolutely centered on mobile
+            with ui.element("div").classes(
+                "max-md:absolute max-md:left-1/2 max-md:-translate-x-1/2"
+            ):
                 with ui.link(target=pages.HOME_PAGE).classes("no-underline"):
                     ui.html(styles.LOGO_SVG, sanitize=False)
 
             # Spacer to push Add button to the right
             ui.space()
 
-            # Quick add expense button (mobile: icon only)
+            # Quick add expense button (desktop: icon + text, mobile: icon only)
             with ui.link(target="/quick-add").classes("no-underline"):
                 with ui.button().props(HEADER_BUTTON_PROPS):
                     ui.html(styles.ADD_SVG, sanitize=False)
+                    ui.label("Add").classes("ml-1 max-md:hidden")
                 ui.tooltip("Add Expense")
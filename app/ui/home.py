@@ -1,6 +1,8 @@
+import asyncio
+from collections.abc import Callable
 from typing import Any, Literal
 
-from nicegui import app, ui
+from nicegui import ui
 
 from app.core.constants import (
     CACHE_TTL_SECONDS,
@@ -11,13 +13,22 @@ from app.core.state_manager import state_manager
 from app.services import pages, utils
 from app.services.finance_service import FinanceService
 from app.ui import charts, header, styles
-from app.ui.common import get_user_preferences
+from app.ui.common import PageRenderer, navigate_to
 from app.ui.components.skeleton import render_chart_skeleton, render_kpi_card_skeleton
 from app.ui.data_loading import render_with_data_loading
 from app.ui.rendering_utils import render_no_data_message
 
+# Options builder and chart_data key for each dashboard chart type
+CHART_BUILDERS: dict[str, tuple[Callable[..., dict[str, Any]], str]] = {
+    "net_worth": (charts.create_net_worth_chart_options, "net_worth_data"),
+    "asset_vs_liabilities": (charts.create_asset_vs_liabilities_chart, "asset_vs_liabilities_data"),
+    "cash_flow": (charts.create_cash_flow_options, "cash_flow_data"),
+    "avg_expenses": (charts.create_avg_expenses_options, "avg_expenses"),
+    "income_vs_expenses": (charts.create_income_vs_expenses_options, "incomes_vs_expenses_data"),
+}
 
-class HomeRenderer:
+
+class HomeRenderer(PageRenderer):
     """Home dashboard renderer with clean separation of concerns."""
 
     def __init__(self):
@@ -31,13 +42,18 @@ class HomeRenderer:
         as it creates the FinanceCalculator only once.
 
         Returns:
-            Dictionary with 'kpi_data' and 'chart_data' keys, or None if data unavailable
+            Dictionary with 'kpi_data', 'chart_data' and 'chart_options' keys, or None
+            if data unavailable
         """
         if not self.finance_service.has_required_data():
             return None
 
         def compute_dashboard_data():
-            return self.finance_service.get_dashboard_data()
+            dashboard_data = self.finance_service.get_dashboard_data()
+            if dashboard_data is not None:
+                # Chart options built from this entry, filled in lazily by render_chart
+                dashboard_data["chart_options"] = {}
+            return dashboard_data
 
         return await state_manager.get_or_compute(
             user_storage_key="assets_sheet",
@@ -51,11 +67,6 @@ class HomeRenderer:
         dashboard_data = await self.load_dashboard_data()
         return dashboard_data["kpi_data"] if dashboard_data else None
 
-    async def load_chart_data(self) -> dict[str, Any] | None:
-        """Load chart data from dashboard data cache."""
-        dashboard_data = await self.load_dashboard_data()
-        return dashboard_data["chart_data"] if dashboard_data else None
-
     async def render_kpi_cards(self, container: ui.row) -> None:
         """Render KPI cards with real data, replacing skeleton loaders."""
         kpi_data = await self.load_kpi_data()
@@ -66,8 +77,8 @@ class HomeRenderer:
                 ui.label("No data available").classes("text-center text-gray-500")
             return
 
-        # Get user currency preference (from general storage - shared across devices)
-        user_currency: str = app.storage.general.get("currency", utils.get_user_currency())
+        # Get user currency preference (resolved once per page)
+        user_currency = self.prefs.currency
 
         async with container:
             net_worth_value = utils.format_currency(kpi_data["net_worth"], user_currency)
@@ -93,7 +104,7 @@ class HomeRenderer:
             with (
                 ui.card()
                 .classes("cursor-pointer " + styles.STAT_CARDS_CLASSES)
-                .on("click", lambda: ui.navigate.to(pages.NET_WORTH_PAGE))
+                .on("click", navigate_to(pages.NET_WORTH_PAGE))
             ):
                 ui.label("Net Worth").classes(styles.STAT_CARDS_LABEL_CLASSES)
                 ui.label(net_worth_value).classes(styles.STAT_CARDS_VALUE_CLASSES)
@@ -103,44 +114,35 @@ class HomeRenderer:
             with ui.card().classes(styles.STAT_CARDS_CLASSES):
                 ui.tooltip("Change vs previous month").classes("tooltip")
                 ui.label("MoM Δ").classes(styles.STAT_CARDS_LABEL_CLASSES)
-                sign = "+"
-                text_color = "text-success"
                 if kpi_data["mom_variation_percentage"] < 0:
-                    text_color = "text-error"
-                    sign = "-"
-                ui.label(sign + mom_variation_percentage_value).classes(
-                    text_color + styles.STAT_CARDS_VALUE_CLASSES
-                )
+                    sign, value_classes = "-", styles.STAT_CARDS_VALUE_ERROR_CLASSES
+                else:
+                    sign, value_classes = "+", styles.STAT_CARDS_VALUE_SUCCESS_CLASSES
+                ui.label(sign + mom_variation_percentage_value).classes(value_classes)
                 ui.label(sign + mom_variation_absolute_value + " compared to last month").classes(
                     styles.STAT_CARDS_DESC_CLASSES
                 )
             with ui.card().classes(styles.STAT_CARDS_CLASSES):
                 ui.tooltip("Change vs same month last year").classes("tooltip")
                 ui.label("YoY Δ").classes(styles.STAT_CARDS_LABEL_CLASSES)
-                sign = "+"
-                text_color = "text-success"
                 if kpi_data["yoy_variation_percentage"] < 0:
-                    text_color = "text-error"
-                    sign = "-"
-                ui.label(sign + yoy_variation_percentage_value).classes(
-                    text_color + styles.STAT_CARDS_VALUE_CLASSES
-                )
+                    sign, value_classes = "-", styles.STAT_CARDS_VALUE_ERROR_CLASSES
+                else:
+                    sign, value_classes = "+", styles.STAT_CARDS_VALUE_SUCCESS_CLASSES
+                ui.label(sign + yoy_variation_percentage_value).classes(value_classes)
                 ui.label(sign + yoy_variation_absolute_value + " compared to last year").classes(
                     styles.STAT_CARDS_DESC_CLASSES
                 )
             with ui.card().classes(styles.STAT_CARDS_CLASSES):
                 ui.tooltip("Average monthly Saving Ratio of last 12 months").classes("tooltip")
                 ui.label("Avg Saving Ratio").classes(styles.STAT_CARDS_LABEL_CLASSES)
-                text_color = ""
                 if kpi_data["avg_saving_ratio_percentage"] < SAVING_RATIO_THRESHOLD_LOW:
-                    text_color = "text-error"
+                    value_classes = styles.STAT_CARDS_VALUE_ERROR_CLASSES
                 elif kpi_data["avg_saving_ratio_percentage"] < SAVING_RATIO_THRESHOLD_MEDIUM:
-                    text_color = "text-warning"
+                    value_classes = styles.STAT_CARDS_VALUE_WARNING_CLASSES
                 else:
-                    text_color = "text-success"
-                ui.label(avg_saving_ratio_percentage_value).classes(
-                    text_color + styles.STAT_CARDS_VALUE_CLASSES
-                )
+                    value_classes = styles.STAT_CARDS_VALUE_SUCCESS_CLASSES
+                ui.label(avg_saving_ratio_percentage_value).classes(value_classes)
                 ui.label(avg_saving_ratio_absolute_value + " saved on average each month").classes(
                     styles.STAT_CARDS_DESC_CLASSES
                 )
@@ -155,15 +157,28 @@ class HomeRenderer:
         tooltip: str | None = None,
     ) -> None:
         """Render a specific chart type into the given container."""
-        chart_data = await self.load_chart_data()
+        dashboard_data = await self.load_dashboard_data()
         container.clear()
 
-        if not chart_data:
+        if not dashboard_data or not dashboard_data["chart_data"]:
             render_no_data_message(container, title, tooltip or "")
             return
 
-        # Get user preferences using centralized utility
-        prefs = get_user_preferences()
+        # Get user preferences (resolved once per page)
+        prefs = self.prefs
+
+        # Chart options are cached per layout and currency inside the dashboard entry
+        # they are built from, so they are invalidated and recomputed together with it.
+        # A miss builds them off the event loop
+        options_cache = dashboard_data["chart_options"]
+        options_key = (chart_type, prefs.user_agent, prefs.currency)
+        options = options_cache.get(options_key)
+        if options is None:
+            options_fn, data_key = CHART_BUILDERS[chart_type]
+            options = await asyncio.to_thread(
+                options_fn, dashboard_data["chart_data"][data_key], prefs.user_agent, prefs.currency
+            )
+            options_cache[options_key] = options
 
         async with container:
             ui.label(title).classes(styles.CHART_CARDS_LABEL_CLASSES)
@@ -171,27 +186,6 @@ class HomeRenderer:
             if tooltip:
                 ui.tooltip(tooltip)
 
-            if chart_type == "net_worth":
-                options = charts.create_net_worth_chart_options(
-                    chart_data["net_worth_data"], prefs.user_agent, prefs.currency
-                )
-            elif chart_type == "asset_vs_liabilities":
-                options = charts.create_asset_vs_liabilities_chart(
-                    chart_data["asset_vs_liabilities_data"], prefs.user_agent, prefs.currency
-                )
-            elif chart_type == "cash_flow":
-                options = charts.create_cash_flow_options(
-                    chart_data["cash_flow_data"], prefs.user_agent, prefs.currency
-                )
-            elif chart_type == "avg_expenses":
-                options = charts.create_avg_expenses_options(
-                    chart_data["avg_expenses"], prefs.user_agent, prefs.currency
-                )
-            elif chart_type == "income_vs_expenses":
-                options = charts.create_income_vs_expenses_options(
-                    chart_data["incomes_vs_expenses_data"], prefs.user_agent, prefs.currency
-                )
-
             ui.echart(options=options, theme=prefs.echart_theme).classes(
                 styles.CHART_CARDS_CHARTS_CLASSES
             )
@@ -4,6 +4,7 @@ from nicegui import ui
 
 from app.services import pages
 from app.ui import styles
+from app.ui.common import navigate_to
 
 
 def render() -> None:
@@ -26,7 +27,7 @@ def render() -> None:
         # Action button
         with (
             ui.element("button")
-            .on("click", lambda: ui.navigate.to(pages.HOME_PAGE))
+            .on("click", navigate_to(pages.HOME_PAGE))
             .classes("btn bg-secondary hover:bg-secondary/80 text-secondary-content gap-2 mt-4")
         ):
             ui.html(styles.HOME_SVG, sanitize=False)
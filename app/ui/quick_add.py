@@ -180,7 +180,7 @@ def render() -> None:
                 month = int(month_select.value)
                 year = int(year_select.value)
                 date_str = f"{year:04d}-{month:02d}-01"
-                user_currency = app.storage.general.get("currency", utils.get_user_currency())
+                user_currency = app.storage.general.get("currency") or utils.get_user_currency()
                 amount_formatted = utils.format_currency(
                     amount_input.value, user_currency, decimals=2
                 )
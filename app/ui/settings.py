@@ -92,7 +92,9 @@ def render() -> None:
                         )
 
                     # Get current currency: use stored preference or detect from locale
-                    current_currency: str = app.storage.general.get("currency", get_user_currency())
+                    current_currency: str = (
+                        app.storage.general.get("currency") or get_user_currency()
+                    )
                     # Save it if it wasn't stored yet
                     if "currency" not in app.storage.general:
                         app.storage.general["currency"] = current_currency
@@ -15,6 +15,9 @@ LOADING_SPINNER_COLOR: str = "primary"
 STAT_CARDS_CLASSES: str = " stat bg-base-100 shadow-md"
 STAT_CARDS_LABEL_CLASSES: str = " stat-title text-lg"
 STAT_CARDS_VALUE_CLASSES: str = " stat-value"
+STAT_CARDS_VALUE_SUCCESS_CLASSES: str = "text-success" + STAT_CARDS_VALUE_CLASSES
+STAT_CARDS_VALUE_WARNING_CLASSES: str = "text-warning" + STAT_CARDS_VALUE_CLASSES
+STAT_CARDS_VALUE_ERROR_CLASSES: str = "text-error" + STAT_CARDS_VALUE_CLASSES
 STAT_CARDS_DESC_CLASSES: str = " stat-desc text-bold"
 
 # Chart card styles (DaisyUI)
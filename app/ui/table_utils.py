@@ -5,32 +5,36 @@ CSV exports, and related UI elements used across multiple pages.
 """
 
 from datetime import datetime
-from io import StringIO
 
 import pandas as pd
 from nicegui import ui
 
 
-def render_mobile_table_message() -> None:
+def render_mobile_table_message(hide_on_desktop: bool = True) -> None:
     """Render mobile-only message explaining data tables are hidden.
 
     Displays a card with icon and text explaining that data tables are only
     visible on desktop and tablet devices, not on mobile.
 
-    This component should be rendered inside a container and is automatically
+    This component should be rendered inside a container and is by default
     hidden on medium+ screen sizes via Tailwind's md:hidden class.
 
+    Args:
+        hide_on_desktop: Hide the message on medium+ screens. Pass False when the
+            table was skipped server-side (mobile user agent), so the message stays
+            visible on wide mobile viewports such as landscape phones.
+
     Example:
         >>> with ui.column():
         >>>     render_mobile_table_message()
     """
-    with (
-        ui.card()
-        .classes(
-            "w-full max-w-screen-xl mx-auto p-6 flex items-center justify-center bg-base-100 shadow-md md:hidden"
-        )
-        .style("min-height: 200px;")
-    ):
+    card_classes = (
+        "w-full max-w-screen-xl mx-auto p-6 flex items-center justify-center bg-base-100 shadow-md"
+    )
+    if hide_on_desktop:
+        card_classes += " md:hidden"
+
+    with ui.card().classes(card_classes).style("min-height: 200px;"):
         with ui.column().classes("items-center gap-3 text-center"):
             ui.icon("table_chart", size="56px").classes("text-base-content/40")
             ui.label("Where's my data table?").classes("text-xl font-semibold text-base-content")
@@ -43,6 +47,7 @@ def export_dataframe_to_csv(
     df: pd.DataFrame,
     filename_prefix: str,
     columns_to_drop: list[str] | None = None,
+    column_names: dict[str, str] | None = None,
 ) -> None:
     """Export DataFrame to CSV file with automatic download.
 
@@ -53,25 +58,34 @@ def export_dataframe_to_csv(
         df: DataFrame to export.
         filename_prefix: Prefix for the filename (e.g., "kanso_expenses").
         columns_to_drop: Optional list of column names to exclude from export.
+        column_names: Optional mapping of column name to CSV header. When given, only
+            these columns are written, in mapping order, with the mapped headers.
 
     Example:
         >>> df = pd.DataFrame({"Date": ["2024-01"], "Amount": [100.50]})
         >>> export_dataframe_to_csv(df, "kanso_assets", columns_to_drop=["Date_DT"])
         # Downloads: kanso_assets_20241106_143022.csv
     """
-    # Create clean DataFrame for export
-    df_export = df.copy()
-
-    # Drop unwanted columns
+    # Drop unwanted columns (drop returns a new frame, the caller's DataFrame is untouched)
+    df_export = df
     if columns_to_drop:
         existing_cols_to_drop = [col for col in columns_to_drop if col in df_export.columns]
         if existing_cols_to_drop:
             df_export = df_export.drop(columns=existing_cols_to_drop)
 
-    # Convert to CSV
-    csv_buffer = StringIO()
-    df_export.to_csv(csv_buffer, index=False)
-    csv_content = csv_buffer.getvalue()
+    # Convert to CSV directly (no defensive copy, no intermediate buffer);
+    # to_csv selects and renames columns while writing
+    if column_names:
+        existing_names = {
+            col: name for col, name in column_names.items() if col in df_export.columns
+        }
+        csv_content = df_export.to_csv(
+            index=False,
+            columns=list(existing_names.keys()),
+            header=list(existing_names.values()),
+        )
+    else:
+        csv_content = df_export.to_csv(index=False)
 
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -86,6 +100,7 @@ def create_csv_export_button(
     df: pd.DataFrame,
     filename_prefix: str,
     columns_to_drop: list[str] | None = None,
+    column_names: dict[str, str] | None = None,
 ) -> ui.button:
     """Create a CSV export button for a DataFrame.
 
@@ -93,6 +108,8 @@ def create_csv_export_button(
         df: DataFrame to export when clicked.
         filename_prefix: Prefix for the filename (e.g., "kanso_expenses").
         columns_to_drop: Optional list of column names to exclude from export.
+        column_names: Optional mapping of column name to CSV header (see
+            export_dataframe_to_csv).
 
     Returns:
         Configured button element with export functionality.
@@ -104,7 +121,7 @@ def create_csv_export_button(
     """
 
     def export_csv():
-        export_dataframe_to_csv(df, filename_prefix, columns_to_drop)
+        export_dataframe_to_csv(df, filename_prefix, columns_to_drop, column_names)
 
     return (
         ui.button(icon="download", on_click=export_csv).props("flat dense").tooltip("Export to CSV")
@@ -0,0 +1,143 @@
+"""Tests for the cached expenses table payload built by app/ui/expenses.py."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from app.core.constants import (
+    COL_AMOUNT_PARSED,
+    COL_CATEGORY,
+    COL_DATE,
+    COL_DATE_DT,
+    COL_MERCHANT,
+    COL_TYPE,
+)
+from app.core.state_manager import StateManager
+from app.logic.finance_calculator import FinanceCalculator
+from app.services.utils import read_json
+from app.ui import expenses
+from app.ui.expenses import TABLE_COLUMNS, ExpensesRenderer, build_expenses_table_data
+
+
+def _processed_df(**overrides) -> pd.DataFrame:
+    """Build a small processed expenses DataFrame, with optional column overrides."""
+    data = {
+        COL_DATE: pd.to_datetime(["2024-01-15", "2024-02-03"]),
+        COL_MERCHANT: ["Store A", "Store B"],
+        COL_AMOUNT_PARSED: [1234.5600000001, 9.999],
+        COL_CATEGORY: ["Food", "Transport"],
+        COL_TYPE: ["Variable", "Fixed"],
+        COL_DATE_DT: pd.to_datetime(["2024-01-15", "2024-02-03"]),
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+
+def test_rows_keys_and_order():
+    """Rows carry exactly the displayed columns, in table order."""
+    data = build_expenses_table_data(_processed_df())
+
+    assert data["total_count"] == 2
+    assert [list(row) for row in data["rows"]] == [TABLE_COLUMNS, TABLE_COLUMNS]
+    assert data["rows"][0][COL_MERCHANT] == "Store A"
+    assert data["rows"][1][COL_CATEGORY] == "Transport"
+    assert data["rows"][1][COL_TYPE] == "Fixed"
+
+
+def test_datetime_date_converted_to_iso_date():
+    """A datetime Date column (as loaded from Google Sheets) becomes YYYY-MM-DD strings."""
+    data = build_expenses_table_data(_processed_df())
+
+    assert [row[COL_DATE] for row in data["rows"]] == ["2024-01-15", "2024-02-03"]
+    assert data["export_df"][COL_DATE].tolist() == ["2024-01-15", "2024-02-03"]
+
+
+def test_string_date_kept_as_is():
+    """Dates already stored as strings are passed through unchanged."""
+    data = build_expenses_table_data(_processed_df(**{COL_DATE: ["2024-01-15", "2024-02-03"]}))
+
+    assert [row[COL_DATE] for row in data["rows"]] == ["2024-01-15", "2024-02-03"]
+
+
+def test_missing_type_column_filled_with_empty_string():
+    """A sheet without a Type column yields empty Type values in every row."""
+    df = _processed_df().drop(columns=[COL_TYPE])
+
+    data = build_expenses_table_data(df)
+
+    assert [row[COL_TYPE] for row in data["rows"]] == ["", ""]
+    assert COL_TYPE not in data["export_df"].columns
+
+
+def test_amounts_rounded_to_cents():
+    """Amounts are quantized to two decimals in rows and export data."""
+    data = build_expenses_table_data(_processed_df())
+
+    assert [row[COL_AMOUNT_PARSED] for row in data["rows"]] == [1234.56, 10.0]
+    assert data["export_df"][COL_AMOUNT_PARSED].tolist() == [1234.56, 10.0]
+
+
+def test_export_df_keeps_only_displayed_columns():
+    """Helper columns (e.g. date_dt) are dropped from the export DataFrame."""
+    data = build_expenses_table_data(_processed_df())
+
+    assert list(data["export_df"].columns) == TABLE_COLUMNS
+
+
+def test_payload_from_calculator_processed_expenses():
+    """The payload builds from a real FinanceCalculator processed DataFrame."""
+    expenses_df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2024-01-01", "2024-02-01"]),
+            "Merchant": ["Store A", "Store B"],
+            "Amount": ["€ 1.000,50", "€ 500"],
+            "Category": ["Food", "Transport"],
+            "Type": ["Variable", "Fixed"],
+        }
+    )
+    calculator = FinanceCalculator(expenses_df=expenses_df)
+
+    data = build_expenses_table_data(calculator.processed_expenses_df)
+
+    assert data["total_count"] == 2
+    assert sorted(row[COL_DATE] for row in data["rows"]) == ["2024-01-01", "2024-02-01"]
+    assert sorted(row[COL_AMOUNT_PARSED] for row in data["rows"]) == [500.0, 1000.5]
+    assert list(data["export_df"].columns) == TABLE_COLUMNS
+
+
+def _expenses_sheet(amount: str) -> str:
+    """Build an expenses sheet JSON string, as stored in general storage."""
+    return pd.DataFrame(
+        {
+            "Date": ["2024-01-01"],
+            "Merchant": ["Store A"],
+            "Amount": [amount],
+            "Category": ["Food"],
+            "Type": ["Variable"],
+        }
+    ).to_json(orient="split")
+
+
+@pytest.mark.asyncio
+async def test_refresh_during_load_does_not_cache_old_rows_for_new_sheet():
+    """Rows built from a sheet replaced mid-load are not served for the new sheet."""
+    general = {"expenses_sheet": _expenses_sheet("€ 100")}
+
+    def read_during_refresh(data):
+        # A data refresh lands while the calculator is being built from the old sheet
+        general["expenses_sheet"] = _expenses_sheet("€ 999")
+        return read_json(data)
+
+    with (
+        patch("app.core.state_manager.app.storage") as sm_storage,
+        patch("app.ui.expenses.app.storage") as ui_storage,
+        patch.object(expenses, "state_manager", StateManager()),
+    ):
+        sm_storage.general = ui_storage.general = general
+        with patch("app.ui.expenses.utils.read_json", read_during_refresh):
+            stale = await ExpensesRenderer().load_expenses_data()
+        fresh = await ExpensesRenderer().load_expenses_data()
+
+    assert stale["rows"][0][COL_AMOUNT_PARSED] == 100.0
+    assert fresh["rows"][0][COL_AMOUNT_PARSED] == 999.0
@@ -413,6 +413,20 @@ class TestFinanceCalculator:
         # Sample data has various types
         assert "Essential" in expenses or "Discretionary" in expenses or len(expenses) > 0
 
+    def test_get_expenses_aggregates(self, calculator_with_expenses):
+        """Test combined expense aggregates match the individual breakdowns."""
+        aggregates = calculator_with_expenses.get_expenses_aggregates()
+
+        assert aggregates["yoy"] == calculator_with_expenses.get_expenses_yoy_comparison()
+        assert (
+            aggregates["by_merchant"]
+            == calculator_with_expenses.get_expenses_by_merchant_last_12_months()
+        )
+        assert (
+            aggregates["by_type"] == calculator_with_expenses.get_expenses_by_type_last_12_months()
+        )
+        assert set(aggregates) == {"yoy", "by_merchant", "by_type"}
+
     def test_get_fi_progress(self, calculator):
         """Test FI (Financial Independence) progress calculation."""
         fi_progress = calculator.get_fi_progress()
@@ -0,0 +1,125 @@
+"""Tests for the sidebar last-refresh timestamp in app/ui/header.py."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from nicegui import Client, ui
+from nicegui.page import page
+
+from app.ui import header
+from app.ui.header import _next_check_interval, _update_timestamp_subscribers
+
+
+class TestNextCheckInterval:
+    """Tests for _next_check_interval back-off."""
+
+    def test_no_refresh_yet(self):
+        assert _next_check_interval(None) == 5.0
+
+    def test_under_a_minute(self):
+        assert _next_check_interval(0) == 5.0
+        assert _next_check_interval(59) == 5.0
+
+    def test_minutes(self):
+        assert _next_check_interval(60) == 60.0
+        assert _next_check_interval(3599) == 60.0
+
+    def test_hours_and_more(self):
+        assert _next_check_interval(3600) == 300.0
+        assert _next_check_interval(86400 * 30) == 300.0
+
+
+class TestUpdateTimestampSubscribers:
+    """Tests for the shared timer callback."""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        """Isolate module-level subscriber state between tests."""
+        with (
+            patch.dict(header._timestamp_subscribers, clear=True),
+            patch.dict(header._timestamp_state, {"last_refresh": None, "next_format_at": 0.0}),
+        ):
+            yield
+
+    @staticmethod
+    def _subscribe() -> Mock:
+        update = Mock()
+        header._timestamp_subscribers[Mock(is_deleted=False)] = update
+        return update
+
+    def test_unchanged_old_refresh_is_not_reformatted_every_tick(self):
+        """An hours-old refresh is pushed once, then skipped until its back-off elapses."""
+        update = self._subscribe()
+        with patch("app.ui.header.app.storage") as mock_storage:
+            mock_storage.general = {"last_data_refresh": "2020-01-01T00:00:00Z"}
+            _update_timestamp_subscribers()
+            _update_timestamp_subscribers()
+
+        update.assert_called_once()
+        formatted, _ = update.call_args.args[0]
+        assert formatted == "2020-01-01 00:00:00"
+
+    def test_new_refresh_pushed_on_next_tick(self):
+        """A new refresh is shown immediately, even while an old one is backed off."""
+        update = self._subscribe()
+        with patch("app.ui.header.app.storage") as mock_storage:
+            mock_storage.general = {"last_data_refresh": "2020-01-01T00:00:00Z"}
+            _update_timestamp_subscribers()
+            mock_storage.general = {"last_data_refresh": "2020-01-02T00:00:00Z"}
+            _update_timestamp_subscribers()
+
+        assert update.call_count == 2
+        formatted, _ = update.call_args.args[0]
+        assert formatted == "2020-01-02 00:00:00"
+
+    def test_deleted_container_unsubscribed(self):
+        """Containers of closed pages are dropped without being updated."""
+        update = Mock()
+        header._timestamp_subscribers[Mock(is_deleted=True)] = update
+        with patch("app.ui.header.app.storage") as mock_storage:
+            mock_storage.general = {"last_data_refresh": "2020-01-01T00:00:00Z"}
+            _update_timestamp_subscribers()
+
+        update.assert_not_called()
+        assert header._timestamp_subscribers == {}
+
+    def test_deleted_container_unsubscribed_while_backed_off(self):
+        """Closed pages are dropped on the next tick even when no update is due."""
+        self._subscribe()
+        with patch("app.ui.header.app.storage") as mock_storage:
+            mock_storage.general = {"last_data_refresh": "2020-01-01T00:00:00Z"}
+            _update_timestamp_subscribers()
+            [container] = header._timestamp_subscribers
+            container.is_deleted = True
+            _update_timestamp_subscribers()
+
+        assert header._timestamp_subscribers == {}
+
+    def test_updates_rendered_page_outside_slot_context(self):
+        """The shared timer updates label and tooltip without a page slot, every time."""
+        client = Client(page(""), request=None)
+        with (
+            patch("app.ui.header.app.storage") as mock_storage,
+            patch.object(header, "_timestamp_timer", Mock()),
+        ):
+            mock_storage.general = {"last_data_refresh": "2020-01-01T00:00:00Z"}
+            with client:
+                header.render_last_refresh_timestamp()
+            [container] = header._timestamp_subscribers
+            label = next(
+                el
+                for el in container.descendants()
+                if isinstance(el, ui.label) and "italic" in el.classes
+            )
+            tooltip = next(el for el in container.descendants() if isinstance(el, ui.tooltip))
+            assert tooltip.text == "2020-01-01 00:00:00"
+
+            # Timer ticks run with an empty slot stack (no `with client:`)
+            for day in ("02", "03"):
+                mock_storage.general = {"last_data_refresh": f"2020-01-{day}T00:00:00Z"}
+                _update_timestamp_subscribers()
+                assert container in header._timestamp_subscribers
+                assert tooltip.text == f"2020-01-{day} 00:00:00"
+                assert label.text.endswith("ago")
+
+        client.delete()
@@ -182,3 +182,190 @@ class TestStateManager:
         # Missing ttl
         invalid_entry2 = {"timestamp": current_time}
         assert manager._is_cache_valid(invalid_entry2) is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_computation(self, manager):
+        """Test concurrent callers for the same entry trigger a single computation."""
+        calls = 0
+
+        def compute_fn():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return 42
+
+        mock_general_storage = Mock()
+        mock_general_storage.get.return_value = "test_data"
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            results = await asyncio.gather(
+                *(manager.get_or_compute("data", "test_key", compute_fn) for _ in range(4))
+            )
+
+        assert results == [42, 42, 42, 42]
+        assert calls == 1
+        assert manager._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_failure(self, manager):
+        """Test a failed computation is propagated to waiters and not cached."""
+        compute_fn = Mock(side_effect=ValueError("boom"))
+
+        mock_general_storage = Mock()
+        mock_general_storage.get.return_value = "test_data"
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            results = await asyncio.gather(
+                manager.get_or_compute("data", "test_key", compute_fn),
+                manager.get_or_compute("data", "test_key", compute_fn),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert manager._in_flight == {}
+        assert manager._cache == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, manager):
+        """Test cancelling the caller that started a computation keeps it for the others."""
+
+        def compute_fn():
+            time.sleep(0.05)
+            return 42
+
+        mock_general_storage = Mock()
+        mock_general_storage.get.return_value = "test_data"
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            first = asyncio.create_task(manager.get_or_compute("data", "test_key", compute_fn))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(manager.get_or_compute("data", "test_key", compute_fn))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second == 42
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+            # The result was cached even though its starter was cancelled
+            compute_again = Mock(return_value=0)
+            assert await manager.get_or_compute("data", "test_key", compute_again) == 42
+            compute_again.assert_not_called()
+
+        assert manager._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_ok_serves_expired_entry_and_refreshes(self, manager):
+        """Test stale_ok returns the expired value and recomputes it in the background."""
+        call_count = [0]
+
+        def compute_fn():
+            call_count[0] += 1
+            return call_count[0]
+
+        mock_general_storage = Mock()
+        mock_general_storage.get.return_value = "test_data"
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            result1 = await manager.get_or_compute("data", "test_key", compute_fn, stale_ok=True)
+
+            # Expire the entry without waiting for the TTL
+            for entry in manager._cache.values():
+                entry["timestamp"] -= 10
+
+            result2 = await manager.get_or_compute("data", "test_key", compute_fn, stale_ok=True)
+            # Let the background refresh complete
+            await asyncio.gather(*manager._refresh_tasks)
+            result3 = await manager.get_or_compute("data", "test_key", compute_fn, stale_ok=True)
+
+        assert result1 == 1
+        assert result2 == 1  # Stale value served immediately
+        assert result3 == 2  # Refreshed value
+        assert call_count[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_data_change_evicts_superseded_entry(self, manager):
+        """Test storing a result for new data drops the entry for the old data."""
+        mock_general_storage = Mock()
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            mock_general_storage.get.return_value = "data_v1"
+            await manager.get_or_compute("data", "test_key", lambda: 1)
+            await manager.get_or_compute("data", "other_key", lambda: 2)
+
+            mock_general_storage.get.return_value = "data_v2"
+            await manager.get_or_compute("data", "test_key", lambda: 3)
+
+        keys = list(manager._cache.keys())
+        assert len(keys) == 2
+        assert sum(key.startswith("data:test_key:") for key in keys) == 1
+        assert sum(key.startswith("data:other_key:") for key in keys) == 1
+
+    @pytest.mark.asyncio
+    async def test_source_data_pins_cache_key(self, manager):
+        """Test an entry is keyed on the given source data, not on current storage."""
+        mock_general_storage = Mock()
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            mock_general_storage.get.return_value = "data_v1"
+            await manager.get_or_compute("data", "test_key", lambda: 1, source_data="data_v1")
+
+            # Computed from v1 but requested once storage holds v2: a miss, not v1's entry
+            mock_general_storage.get.return_value = "data_v2"
+            result = await manager.get_or_compute(
+                "data", "test_key", lambda: 2, source_data="data_v2"
+            )
+
+        assert result == 2
+        assert list(manager._cache) == [manager._get_cache_key("data", "test_key", "data_v2")]
+
+    @pytest.mark.asyncio
+    async def test_data_change_during_compute_not_cached(self, manager):
+        """Test a result whose source data was replaced while computing is not cached."""
+        mock_general_storage = Mock()
+
+        def compute_fn():
+            # A data refresh lands while computing from v1
+            mock_general_storage.get.return_value = "data_v2"
+            return 1
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            mock_general_storage.get.return_value = "data_v1"
+            result = await manager.get_or_compute("data", "test_key", compute_fn)
+            assert manager._cache == {}
+
+            # A v2 entry is not evicted by a late result computed from v1
+            await manager.get_or_compute("data", "test_key", lambda: 2)
+            await manager.get_or_compute("data", "test_key", lambda: 1, source_data="data_v1")
+
+        # Returned to its caller, but only the current data's entry is cached
+        assert result == 1
+        assert list(manager._cache) == [manager._get_cache_key("data", "test_key", "data_v2")]
+
+    @pytest.mark.asyncio
+    async def test_stale_refresh_keeps_scheduled_cache_key(self, manager):
+        """Test a background refresh is not filed under data replaced before it runs."""
+        mock_general_storage = Mock()
+        mock_general_storage.get.return_value = "data_v1"
+
+        with patch("app.core.state_manager.app.storage") as mock_storage:
+            mock_storage.general = mock_general_storage
+            await manager.get_or_compute("data", "test_key", lambda: 1, stale_ok=True)
+            for entry in manager._cache.values():
+                entry["timestamp"] -= 10
+
+            # Serve the stale v1 entry, then replace the data before the refresh runs
+            await manager.get_or_compute("data", "test_key", lambda: 1, stale_ok=True)
+            mock_general_storage.get.return_value = "data_v2"
+            await asyncio.gather(*manager._refresh_tasks)
+
+            result = await manager.get_or_compute("data", "test_key", lambda: 2)
+
+        assert result == 2
@@ -3,8 +3,10 @@
 from unittest.mock import MagicMock
 
 import pandas as pd
+from nicegui import Client, ui
+from nicegui.page import page
 
-from app.ui.table_utils import export_dataframe_to_csv
+from app.ui.table_utils import export_dataframe_to_csv, render_mobile_table_message
 
 
 class TestExportDataframeToCSV:
@@ -117,3 +119,63 @@ class TestExportDataframeToCSV:
         csv_content = mock_download.call_args[0][0].decode("utf-8")
         assert "Date,Amount" in csv_content
         assert csv_content.strip() == "Date,Amount"
+
+    def test_export_does_not_modify_source_dataframe(self, monkeypatch):
+        """Test CSV export leaves the (possibly cached) source DataFrame untouched."""
+        monkeypatch.setattr("app.ui.table_utils.ui.download", MagicMock())
+        monkeypatch.setattr("app.ui.table_utils.ui.notify", MagicMock())
+
+        df = pd.DataFrame(
+            {
+                "Date": ["2024-01"],
+                "Date_DT": ["datetime1"],
+                "Amount": [100.50],
+            }
+        )
+
+        export_dataframe_to_csv(df, "test_export", columns_to_drop=["Date_DT"])
+
+        assert list(df.columns) == ["Date", "Date_DT", "Amount"]
+
+    def test_export_with_column_names(self, monkeypatch):
+        """Test CSV export selects and renames columns while writing."""
+        mock_download = MagicMock()
+        monkeypatch.setattr("app.ui.table_utils.ui.download", mock_download)
+        monkeypatch.setattr("app.ui.table_utils.ui.notify", MagicMock())
+
+        df = pd.DataFrame(
+            {
+                "Date_DT": ["datetime1"],
+                "amount_parsed": [100.50],
+                "Date": ["2024-01"],
+            }
+        )
+
+        export_dataframe_to_csv(
+            df,
+            "test_export",
+            column_names={"Date": "Date", "amount_parsed": "Amount", "Missing": "Missing"},
+        )
+
+        csv_content = mock_download.call_args[0][0].decode("utf-8")
+        assert csv_content.splitlines() == ["Date,Amount", "2024-01,100.5"]
+        assert list(df.columns) == ["Date_DT", "amount_parsed", "Date"]
+
+
+class TestRenderMobileTableMessage:
+    """Test the mobile table message card."""
+
+    @staticmethod
+    def _render_card_classes(**kwargs) -> list[str]:
+        client = Client(page(""), request=None)
+        with client, ui.column() as container:
+            render_mobile_table_message(**kwargs)
+        classes = next(el for el in container.descendants() if isinstance(el, ui.card)).classes
+        client.delete()
+        return classes
+
+    def test_hidden_on_desktop_by_default(self):
+        assert "md:hidden" in self._render_card_classes()
+
+    def test_always_visible_when_table_skipped_server_side(self):
+        assert "md:hidden" not in self._render_card_classes(hide_on_desktop=False)
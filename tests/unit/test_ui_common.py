@@ -1,6 +1,44 @@
 """Unit tests for UI common utilities."""
 
-from app.ui.common import get_aggrid_currency_formatter
+from unittest.mock import patch
+
+from app.ui.common import (
+    PageRenderer,
+    get_aggrid_currency_formatter,
+    get_user_preferences,
+    navigate_to,
+)
+
+
+class TestGetUserPreferences:
+    """Test user preferences lookup."""
+
+    def test_stored_currency_skips_locale_detection(self):
+        """A stored currency is used without calling the locale fallback."""
+        with (
+            patch("app.ui.common.app.storage") as mock_storage,
+            patch("app.ui.common.utils.get_user_currency") as mock_get_user_currency,
+        ):
+            mock_storage.general = {"currency": "EUR"}
+            mock_storage.client = {"user_agent": "mobile"}
+            prefs = get_user_preferences()
+
+        assert prefs.currency == "EUR"
+        assert prefs.user_agent == "mobile"
+        mock_get_user_currency.assert_not_called()
+
+    def test_missing_currency_falls_back_to_locale(self):
+        """Without a stored currency the locale-detected currency is used."""
+        with (
+            patch("app.ui.common.app.storage") as mock_storage,
+            patch("app.ui.common.utils.get_user_currency", return_value="GBP"),
+        ):
+            mock_storage.general = {}
+            mock_storage.client = {}
+            prefs = get_user_preferences()
+
+        assert prefs.currency == "GBP"
+        assert prefs.user_agent == "desktop"
 
 
 class TestGetAggridCurrencyFormatter:
@@ -149,3 +187,31 @@ class TestGetAggridCurrencyFormatter:
         for currency in ["EUR", "USD", "GBP", "CHF", "CAD", "AUD", "CNY", "INR", "BRL"]:
             formatter = get_aggrid_currency_formatter(currency)
             assert "minimumFractionDigits: 2" in formatter
+
+
+class TestNavigateTo:
+    """Test navigation click handler factory."""
+
+    def test_handler_reused_per_path(self):
+        """The same path returns the same handler; different paths do not."""
+        assert navigate_to("/") is navigate_to("/")
+        assert navigate_to("/") is not navigate_to("/settings")
+
+    def test_handler_navigates_to_path(self):
+        """Calling the handler navigates to its path."""
+        with patch("app.ui.common.ui.navigate.to") as mock_navigate:
+            navigate_to("/expenses")()
+        mock_navigate.assert_called_once_with("/expenses")
+
+
+class TestPageRenderer:
+    """Test per-page shared renderer state."""
+
+    def test_prefs_resolved_once_per_renderer(self):
+        """Preferences are read once per renderer and shared across its components."""
+        with patch("app.ui.common.get_user_preferences") as mock_get_prefs:
+            renderer = PageRenderer()
+            assert renderer.prefs is renderer.prefs
+            assert PageRenderer().prefs is mock_get_prefs.return_value
+
+        assert mock_get_prefs.call_count == 2
@@ -9,6 +9,7 @@ from app.services.utils import (
     format_timestamp_relative,
     get_currency_from_browser_locale,
     get_current_timestamp,
+    get_timestamp_age_seconds,
 )
 
 
@@ -275,6 +276,31 @@ class TestFormatTimestampRelative:
         assert formatted == "Invalid timestamp"
         assert relative == ""
 
+    def test_relative_time_recomputed_for_cached_timestamp(self):
+        """Repeated calls reuse the parsed timestamp but still compute the current age."""
+        timestamp = (datetime.now(UTC) - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        first = format_timestamp_relative(timestamp)
+        second = format_timestamp_relative(timestamp)
+        assert first == second
+        assert second[1] == "2 hours ago"
+
+
+class TestGetTimestampAgeSeconds:
+    """Tests for get_timestamp_age_seconds function."""
+
+    def test_missing_timestamp_returns_none(self):
+        assert get_timestamp_age_seconds(None) is None
+        assert get_timestamp_age_seconds("") is None
+
+    def test_invalid_timestamp_returns_none(self):
+        assert get_timestamp_age_seconds("not-a-timestamp") is None
+
+    def test_elapsed_seconds(self):
+        timestamp = (datetime.now(UTC) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        age = get_timestamp_age_seconds(timestamp)
+        assert 299 <= age <= 302
+
 
 class TestSecondsToRelative:
     """Tests for _seconds_to_relative helper."""